@@ -3,11 +3,7 @@
 import sys
 from pathlib import Path
 
-# Ensure we can import from src
 project_root = Path(__file__).parent
-src_path = project_root / "src"
-sys.path.insert(0, str(project_root))
-sys.path.insert(0, str(src_path))
 
 if __name__ == "__main__":
     try:
@@ -1,12 +1,14 @@
 #!/usr/bin/env python3
 """Test real end-to-end generation with OpenAI API - Complete Multi-Agent Test"""
 import asyncio
+import os
 import sys
 from pathlib import Path
 
-# Add project root to Python path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+try:
+    import uvloop
+except ImportError:  # Optional; not available on Windows
+    uvloop = None
 
 
 async def test_complete_orchestrator():
@@ -34,8 +36,11 @@ async def test_complete_orchestrator():
             print("Please create test/swagger_files/ directory with your YAML files")
             return False
 
-        swagger_files = list(swagger_dir.glob("*.yaml")) + \
-            list(swagger_dir.glob("*.yml"))
+        with os.scandir(swagger_dir) as entries:
+            swagger_files = sorted(
+                Path(entry.path) for entry in entries
+                if entry.name.endswith((".yaml", ".yml")) and entry.is_file()
+            )
         if not swagger_files:
             print(f"❌ No YAML files found in {swagger_dir}")
             return False
@@ -143,11 +148,11 @@ async def test_complete_orchestrator():
         if artifacts:
             print(f"\n📁 Sample Generated Files:")
 
-            # Group by type and show examples
-            csv_files = [f for f in artifacts if f.endswith('.csv')]
-            feature_files = [f for f in artifacts if f.endswith('.feature')]
-            postman_files = [f for f in artifacts if any(
-                x in f.lower() for x in ['collection', 'environment'])]
+            # Artifacts are already grouped by type in the result
+            artifacts_by_type = result.artifacts_by_type
+            csv_files = artifacts_by_type["csv"]
+            feature_files = artifacts_by_type["feature"]
+            postman_files = artifacts_by_type["postman"]
 
             if csv_files:
                 sample_csv = Path(csv_files[0])
@@ -214,5 +219,6 @@ async def main():
 
 
 if __name__ == "__main__":
-    result = asyncio.run(main())
+    run = uvloop.run if uvloop else asyncio.run
+    result = run(main())
     sys.exit(result)
@@ -1,19 +1,23 @@
 """base agent with dependency injection"""
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional
+import asyncio
 import time
 
 from src.config.settings import Settings
 from src.prompts.manager import PromptManager
-from src.services.llm_service import LLMService
+from src.services.llm_service import LLMService, LLMServiceError
 from src.services.validation_service import ValidationService
-from src.models.agents import AgentInput, AgentOutput, AgentType
+from src.models.agents import AgentInput, AgentOutput, AgentType, Section
 from src.utils.logger import get_logger
 
 
 class BaseAgent(ABC):
     """Abstract base class for all agents with dependency injection"""
 
+    # Batched output schemas keyed by output schema name, shared by all agents
+    _batch_schemas: Dict[str, Dict[str, Any]] = {}
+
     def __init__(self,
                  agent_type: AgentType,
                  prompt_manager: PromptManager,
@@ -25,7 +29,16 @@ class BaseAgent(ABC):
         self.llm_service = llm_service
         self.validation_service = validation_service
         self.settings = settings
-        self.logger = get_logger(f"agent_{agent_type.value}")
+        self._agent_type_value = agent_type.value
+        self.logger = get_logger(f"agent_{self._agent_type_value}")
+        self._log_start_fmt = (
+            f"Starting {self._agent_type_value} agent for section: %s using model: %s")
+        # The model mapping is static per agent, so resolve it once
+        self._agent_model = self.get_model_for_agent()
+        self._output_validator = validation_service.get_validator(
+            self.get_output_schema_name())
+        self._system_template = prompt_manager.compile(
+            self.get_system_prompt_name(), self.get_constant_prompt_variables())
 
     @abstractmethod
     def get_system_prompt_name(self) -> str:
@@ -47,57 +60,79 @@ class BaseAgent(ABC):
         # Use the default model (gpt-4o) for all generation agents
         return self.settings.default_model
 
+    def get_constant_prompt_variables(self) -> Dict[str, Any]:
+        """Get prompt variables that are the same for every section"""
+        return {
+            "agent_type": self._agent_type_value
+        }
+
     def build_prompt_variables(self, input_data: AgentInput) -> Dict[str, Any]:
-        """Build variables for prompt template rendering"""
+        """Build per-section variables for prompt template rendering"""
         return {
             "section_name": input_data.section.name,
             "section_description": input_data.section.description,
-            "endpoint_count": len(input_data.section.endpoints),
-            "test_case_count": len(input_data.section.test_cases),
-            "agent_type": self.agent_type.value
+            "endpoint_count": input_data.section.endpoint_count,
+            "test_case_count": input_data.section.test_case_count
         }
 
     def build_context_messages(self, input_data: AgentInput) -> List[Dict[str, Any]]:
         """Build context messages for the LLM call"""
         # Get rendered system prompt
         prompt_variables = self.build_prompt_variables(input_data)
-        system_prompt = self.prompt_manager.get_prompt(
-            self.get_system_prompt_name(),
-            prompt_variables
-        )
+        system_prompt = self._system_template.render(prompt_variables)
 
         messages = [
             {"role": "system", "content": system_prompt}
         ]
 
         # Add file inputs if available
-        user_content = []
+        user_content = self._build_file_content(input_data)
 
-        # For Swagger files: Check if we have content or file ID
-        if hasattr(input_data, 'swagger_content') and input_data.swagger_content:
-            user_content.append({
-                "type": "input_text",
-                "text": f"## Swagger/OpenAPI Specification\n\n```yaml\n{input_data.swagger_content}\n```"
-            })
-        elif input_data.swagger_file_id:
-            # Fallback to file ID if content not available (shouldn't happen with new approach)
-            user_content.append({
-                "type": "input_file",
-                "file_id": input_data.swagger_file_id
-            })
+        # Add section context
+        user_content.append({
+            "type": "input_text",
+            "text": self._get_section_context(input_data)
+        })
 
-        # For PDF files: Use file ID (supported by Responses API)
-        if input_data.pdf_file_id:
+        messages.append({
+            "role": "user",
+            "content": user_content
+        })
+
+        return messages
+
+    def build_batch_context_messages(self, inputs: List[AgentInput]) -> List[Dict[str, Any]]:
+        """Build context messages for a single LLM call covering several sections"""
+        # Render the system prompt once for the combined sections
+        prompt_variables = self.build_prompt_variables(
+            self._merge_agent_inputs(inputs))
+        system_prompt = self._system_template.render(prompt_variables)
+
+        messages = [
+            {"role": "system", "content": system_prompt}
+        ]
+
+        # All sections of a run share the same input files
+        user_content = self._build_file_content(inputs[0])
+
+        # Add each section in a block labeled with its id
+        for input_data in inputs:
             user_content.append({
-                "type": "input_file",
-                "file_id": input_data.pdf_file_id
+                "type": "input_text",
+                "text": (
+                    f'<section id="{input_data.section.section_id}">\n'
+                    f"{self._get_section_context(input_data)}\n"
+                    "</section>"
+                )
             })
 
-        # Add section context
-        section_context = self._build_section_context(input_data.section)
         user_content.append({
             "type": "input_text",
-            "text": section_context
+            "text": (
+                f"Return exactly {len(inputs)} entries in `sections`, one per "
+                "<section> block above, each with that block's id as `section_id` "
+                "and its complete output as `result`."
+            )
         })
 
         messages.append({
@@ -107,107 +142,243 @@ class BaseAgent(ABC):
 
         return messages
 
-    def _build_section_context(self, section) -> str:
-        """Build context text for the section"""
-        context = f"""
-## Section: {section.name}
+    def _build_file_content(self, input_data: AgentInput) -> List[Dict[str, Any]]:
+        """Build the user content entries for the input files"""
+        return list(input_data.attachments)
 
-**Description:** {section.description}
+    def _get_section_context(self, input_data: AgentInput) -> str:
+        """Get the section context, reusing the one prepared by the orchestrator"""
+        if input_data.prepared_context:
+            return input_data.prepared_context.section_text
+        return self._build_section_context(input_data.section)
 
-**Endpoints to Process:**
-"""
-        for endpoint in section.endpoints:
-            context += f"\n- {endpoint.method} {endpoint.path}"
-            if endpoint.summary:
-                context += f": {endpoint.summary}"
-
-        context += f"\n\n**Test Cases to Generate:**"
-        for test_case in section.test_cases:
-            context += f"\n- {test_case.name} ({test_case.test_type})"
-
-        return context
+    def _build_section_context(self, section) -> str:
+        """Build context text for the section"""
+        return section.context_text
+
+    def _merge_agent_inputs(self, inputs: List[AgentInput]) -> AgentInput:
+        """Combine several agent inputs into one describing all their sections"""
+        sections = [input_data.section for input_data in inputs]
+        merged_section = Section(
+            section_id="+".join(section.section_id for section in sections),
+            name=", ".join(section.name for section in sections),
+            description=f"{len(sections)} API sections processed together: " + "; ".join(
+                section.description for section in sections),
+            endpoints=[
+                endpoint for section in sections for endpoint in section.endpoints],
+            test_cases=[
+                test_case for section in sections for test_case in section.test_cases],
+            estimated_tokens=sum(
+                section.estimated_tokens for section in sections)
+        )
+        return inputs[0].model_copy(
+            update={"section": merged_section, "prepared_context": None})
+
+    def _get_batch_schema(self, schema: Dict[str, Any]) -> Dict[str, Any]:
+        """Get the output schema wrapping one result per section"""
+        schema_name = self.get_output_schema_name()
+        batch_schema = self._batch_schemas.get(schema_name)
+        if batch_schema is None:
+            batch_schema = {
+                "type": "object",
+                "properties": {
+                    "sections": {
+                        "type": "array",
+                        "description": "One entry per section block, labeled with its id",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "section_id": {
+                                    "type": "string",
+                                    "description": "Id of the section block this result is for"
+                                },
+                                "result": schema
+                            },
+                            "required": ["section_id", "result"],
+                            "additionalProperties": False
+                        }
+                    }
+                },
+                "required": ["sections"],
+                "additionalProperties": False
+            }
+            self._batch_schemas[schema_name] = batch_schema
+        return batch_schema
 
     async def execute(self, input_data: AgentInput) -> AgentOutput:
         """Execute the agent with input data and proper token tracking"""
-        start_time = time.time()
-        agent_model = self.get_model_for_agent()
+        start_ns = time.perf_counter_ns()
+        agent_model = self._agent_model
 
         self.logger.info(
-            f"Starting {self.agent_type.value} agent for section: {input_data.section.section_id} "
-            f"using model: {agent_model}"
-        )
+            self._log_start_fmt, input_data.section.section_id, agent_model)
 
         try:
             # Build messages for LLM
             messages = self.build_context_messages(input_data)
 
-            # Get output schema
-            schema = self.validation_service.get_schema(
-                self.get_output_schema_name())
-
             # Make LLM call with structured output using the appropriate model and get token usage
             llm_output, usage_info = await self.llm_service.generate_structured_response(
                 messages=messages,
-                schema=schema,
+                schema=self._output_validator.schema,
                 model=agent_model
             )
+            self._log_token_usage(agent_model, usage_info)
 
-            # Log token usage with model information
-            self.logger.info(
-                f"LLM call completed with {agent_model} - "
-                f"Input: {usage_info['input_tokens']}, "
-                f"Output: {usage_info['output_tokens']}, "
-                f"Total: {usage_info['total_tokens']} tokens"
+        except (LLMServiceError, asyncio.TimeoutError) as e:
+            return self._create_error_output(input_data, e, start_ns)
+
+        return await self._complete_output(
+            llm_output, input_data, usage_info, agent_model, start_ns)
+
+    async def execute_many(self, inputs: List[AgentInput]) -> List[AgentOutput]:
+        """Execute the agent for several sections concurrently, one LLM call each"""
+        return list(await asyncio.gather(*[self.execute(input_data) for input_data in inputs]))
+
+    async def execute_batch(self, inputs: List[AgentInput]) -> List[AgentOutput]:
+        """Execute the agent for several sections with a single LLM call"""
+        if len(inputs) == 1:
+            return [await self.execute(inputs[0])]
+
+        start_ns = time.perf_counter_ns()
+        agent_model = self._agent_model
+
+        self.logger.info(
+            "Starting batched %s agent for %s sections: %s using model: %s",
+            self._agent_type_value,
+            len(inputs),
+            ", ".join(input_data.section.section_id for input_data in inputs),
+            agent_model
+        )
+
+        try:
+            messages = self.build_batch_context_messages(inputs)
+
+            llm_output, usage_info = await self.llm_service.generate_structured_response(
+                messages=messages,
+                schema=self._get_batch_schema(self._output_validator.schema),
+                model=agent_model
             )
+            self._log_token_usage(agent_model, usage_info)
 
-            # Log reasoning tokens if present (for o1 models, though agents shouldn't use them)
-            if usage_info.get('reasoning_tokens', 0) > 0:
-                self.logger.info(
-                    f"Reasoning tokens used: {usage_info['reasoning_tokens']}"
-                )
+        except (LLMServiceError, asyncio.TimeoutError) as e:
+            return [self._create_error_output(input_data, e, start_ns) for input_data in inputs]
 
-            # Validate output
-            validation_errors = self.validation_service.validate(
-                llm_output, schema)
-            if validation_errors:
+        # Match results to sections by their labeled id
+        section_outputs = {}
+        for entry in llm_output.get("sections", []):
+            section_id = entry.get("section_id")
+            if section_id in section_outputs:
                 self.logger.warning(
-                    f"LLM output validation warnings: {validation_errors}")
+                    "Batched response repeated section %s", section_id)
+                continue
+            section_outputs[section_id] = entry.get("result")
+
+        section_ids = {input_data.section.section_id for input_data in inputs}
+        unknown_ids = section_outputs.keys() - section_ids
+        if unknown_ids:
+            self.logger.warning(
+                "Batched response returned unknown sections: %s", sorted(map(str, unknown_ids)))
+
+        # Attribute the shared call's token usage evenly across sections
+        section_usages = self._split_token_usage(usage_info, len(inputs))
+
+        outputs = []
+        for input_data, section_usage in zip(inputs, section_usages):
+            section_output = section_outputs.get(input_data.section.section_id)
+            if section_output is None:
+                outputs.append(self._create_error_output(
+                    input_data, ValueError("Section missing from batched LLM response"), start_ns))
+                continue
+
+            # A failure in one section must not discard the sections already completed
+            try:
+                outputs.append(await self._complete_output(
+                    section_output, input_data, section_usage, agent_model, start_ns))
+            except Exception as e:
+                outputs.append(self._create_error_output(input_data, e, start_ns))
+
+        return outputs
+
+    async def _complete_output(self,
+                               llm_output: Dict[str, Any],
+                               input_data: AgentInput,
+                               usage_info: Dict[str, int],
+                               agent_model: str,
+                               start_ns: int) -> AgentOutput:
+        """Validate and process one section's LLM output and record its metrics"""
+        # Validate output
+        validation_errors = [
+            f"Validation error: {error.message}"
+            for error in self._output_validator.iter_errors(llm_output)
+        ]
+        if validation_errors:
+            self.logger.warning(
+                "LLM output validation warnings: %s", validation_errors)
+
+        # Process into agent-specific output
+        agent_output = await self.process_llm_output(llm_output, input_data)
 
-            # Process into agent-specific output
-            agent_output = await self.process_llm_output(llm_output, input_data)
+        # Update metrics with proper token tracking
+        agent_output.metrics.token_usage.input_tokens = usage_info["input_tokens"]
+        agent_output.metrics.token_usage.output_tokens = usage_info["output_tokens"]
+        agent_output.metrics.token_usage.total_tokens = usage_info["total_tokens"]
 
-            # Update metrics with proper token tracking
-            processing_time = time.time() - start_time
-            agent_output.metrics.processing_time = processing_time
-            agent_output.metrics.token_usage.input_tokens = usage_info["input_tokens"]
-            agent_output.metrics.token_usage.output_tokens = usage_info["output_tokens"]
-            agent_output.metrics.token_usage.total_tokens = usage_info["total_tokens"]
+        # Mark completion time, keeping the monotonic duration of the whole run
+        agent_output.metrics.mark_completed()
+        processing_time = (time.perf_counter_ns() - start_ns) / 1e9
+        agent_output.metrics.processing_time = processing_time
+        agent_output.success = True
 
-            # Mark completion time
-            agent_output.metrics.mark_completed()
-            agent_output.success = True
+        self.logger.info(
+            "✅ %s agent completed in %.2fs (Model: %s, Tokens: %s)",
+            self._agent_type_value,
+            processing_time,
+            agent_model,
+            usage_info['total_tokens']
+        )
+        return agent_output
+
+    def _log_token_usage(self, agent_model: str, usage_info: Dict[str, int]) -> None:
+        """Log token usage with model information"""
+        self.logger.info(
+            "LLM call completed with %s - Input: %s, Output: %s, Total: %s tokens",
+            agent_model,
+            usage_info['input_tokens'],
+            usage_info['output_tokens'],
+            usage_info['total_tokens']
+        )
 
+        # Log reasoning tokens if present (for o1 models, though agents shouldn't use them)
+        if usage_info.get('reasoning_tokens', 0) > 0:
             self.logger.info(
-                f"✅ {self.agent_type.value} agent completed in {processing_time:.2f}s "
-                f"(Model: {agent_model}, Tokens: {usage_info['total_tokens']})"
-            )
-            return agent_output
-
-        except Exception as e:
-            processing_time = time.time() - start_time
-            self.logger.error(f"❌ {self.agent_type.value} agent failed: {e}")
-
-            # Return error output with basic metrics
-            error_output = AgentOutput(
-                agent_type=self.agent_type,
-                section_id=input_data.section.section_id,
-                success=False,
-                errors=[str(e)]
-            )
-            error_output.metrics.processing_time = processing_time
-            error_output.metrics.mark_completed()
+                "Reasoning tokens used: %s", usage_info['reasoning_tokens'])
+
+    def _split_token_usage(self, usage_info: Dict[str, int], count: int) -> List[Dict[str, int]]:
+        """Split token usage evenly across sections, giving remainders to the first"""
+        shares = [{} for _ in range(count)]
+        for key, value in usage_info.items():
+            share, remainder = divmod(value, count)
+            for index, section_usage in enumerate(shares):
+                section_usage[key] = share + (remainder if index == 0 else 0)
+        return shares
+
+    def _create_error_output(self, input_data: AgentInput, error: Exception, start_ns: int) -> AgentOutput:
+        """Create an error output with basic metrics"""
+        processing_time = (time.perf_counter_ns() - start_ns) / 1e9
+        self.logger.error("❌ %s agent failed: %s",
+                          self._agent_type_value, error)
+
+        error_output = AgentOutput(
+            agent_type=self.agent_type,
+            section_id=input_data.section.section_id,
+            success=False,
+            errors=[str(error)]
+        )
+        error_output.metrics.mark_completed()
+        error_output.metrics.processing_time = processing_time
 
-            return error_output
+        return error_output
 
     @abstractmethod
     async def process_llm_output(self, llm_output: Dict[str, Any], input_data: AgentInput) -> AgentOutput:
@@ -1,6 +1,6 @@
 """Mock agent implementation for agents not yet implemented"""
 import asyncio
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from src.models.base import AgentType
 from src.models.agents import AgentInput, AgentOutput
@@ -11,8 +11,15 @@ from src.utils.logger import get_logger
 class MockAgent:
     """Mock agent implementation for testing and development"""
 
-    def __init__(self, agent_type: AgentType):
+    # Mock artifact filename formats, filled with the section id
+    _KARATE_FEATURE_FMT = "mock_karate_{}.feature"
+    _KARATE_DATA_FMT = "mock_data_{}.json"
+    _POSTMAN_COLLECTION_FMT = "mock_postman_{}.json"
+    _POSTMAN_ENVIRONMENT_FMT = "mock_environment_{}.json"
+
+    def __init__(self, agent_type: AgentType, simulated_delay: float = 0.0):
         self.agent_type = agent_type
+        self.simulated_delay = simulated_delay
         self.logger = get_logger(f"mock_agent_{agent_type.value}")
 
     async def execute(self, input_data: AgentInput) -> AgentOutput:
@@ -21,10 +28,25 @@ class MockAgent:
         self.logger.info(
             f"🔨 Mock {self.agent_type.value} agent executing for section: {input_data.section.section_id}")
 
-        # Simulate some processing time
-        await asyncio.sleep(0.5)
+        # Simulate some processing time when running as a demo
+        if self.simulated_delay > 0:
+            await asyncio.sleep(self.simulated_delay)
+
+        return self._create_mock_output(input_data)
+
+    async def execute_batch(self, inputs: List[AgentInput]) -> List[AgentOutput]:
+        """Mock batched execution, matching BaseAgent.execute_batch"""
+        self.logger.info(
+            f"🔨 Mock {self.agent_type.value} agent executing batch of {len(inputs)} sections")
+
+        # One simulated call for the whole batch, like a single batched LLM request
+        if self.simulated_delay > 0:
+            await asyncio.sleep(self.simulated_delay)
 
-        # Create appropriate mock output based on agent type
+        return [self._create_mock_output(input_data) for input_data in inputs]
+
+    def _create_mock_output(self, input_data: AgentInput) -> AgentOutput:
+        """Create the mock output for this agent type"""
         if self.agent_type == AgentType.KARATE:
             return self._create_mock_karate_output(input_data)
         elif self.agent_type == AgentType.POSTMAN:
@@ -34,40 +56,41 @@ class MockAgent:
 
     def _create_mock_karate_output(self, input_data: AgentInput) -> KarateOutput:
         """Create mock Karate output"""
+        section_id = input_data.section.section_id
+        feature_file = self._KARATE_FEATURE_FMT.format(section_id)
         return KarateOutput(
             agent_type=self.agent_type,
-            section_id=input_data.section.section_id,
+            section_id=section_id,
             success=True,
-            artifacts=[f"mock_karate_{input_data.section.section_id}.feature"],
-            feature_files=[
-                f"mock_karate_{input_data.section.section_id}.feature"],
-            data_files=[f"mock_data_{input_data.section.section_id}.json"],
-            scenario_count=len(input_data.section.test_cases),
+            artifacts=[feature_file],
+            feature_files=[feature_file],
+            data_files=[self._KARATE_DATA_FMT.format(section_id)],
+            scenario_count=input_data.section.test_case_count,
             warnings=["This is a mock Karate agent - no actual files generated"],
             metadata={
                 "mock": True,
-                "endpoints_processed": len(input_data.section.endpoints),
-                "test_cases_converted": len(input_data.section.test_cases)
+                "endpoints_processed": input_data.section.endpoint_count,
+                "test_cases_converted": input_data.section.test_case_count
             }
         )
 
     def _create_mock_postman_output(self, input_data: AgentInput) -> PostmanOutput:
         """Create mock Postman output"""
+        section_id = input_data.section.section_id
+        collection_file = self._POSTMAN_COLLECTION_FMT.format(section_id)
+        environment_file = self._POSTMAN_ENVIRONMENT_FMT.format(section_id)
         return PostmanOutput(
             agent_type=self.agent_type,
-            section_id=input_data.section.section_id,
+            section_id=section_id,
             success=True,
-            artifacts=[
-                f"mock_postman_{input_data.section.section_id}.json",
-                f"mock_environment_{input_data.section.section_id}.json"
-            ],
-            collection_file=f"mock_postman_{input_data.section.section_id}.json",
-            environment_file=f"mock_environment_{input_data.section.section_id}.json",
-            request_count=len(input_data.section.endpoints),
+            artifacts=[collection_file, environment_file],
+            collection_file=collection_file,
+            environment_file=environment_file,
+            request_count=input_data.section.endpoint_count,
             warnings=["This is a mock Postman agent - no actual files generated"],
             metadata={
                 "mock": True,
-                "endpoints_processed": len(input_data.section.endpoints),
+                "endpoints_processed": input_data.section.endpoint_count,
                 "collection_name": f"Mock API Tests - {input_data.section.name}"
             }
         )
@@ -84,7 +107,7 @@ class MockAgent:
                 f"This is a mock {self.agent_type.value} agent - no actual files generated"],
             metadata={
                 "mock": True,
-                "endpoints_processed": len(input_data.section.endpoints),
-                "test_cases_processed": len(input_data.section.test_cases)
+                "endpoints_processed": input_data.section.endpoint_count,
+                "test_cases_processed": input_data.section.test_case_count
             }
         )
@@ -0,0 +1,5 @@
+"""Shared schema fragments reused across agent and orchestrator schemas"""
+
+STRING_SCHEMA = {"type": "string"}
+BOOLEAN_SCHEMA = {"type": "boolean"}
+NON_NEGATIVE_INTEGER_SCHEMA = {"type": "integer", "minimum": 0}
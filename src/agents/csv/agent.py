@@ -23,9 +23,10 @@ class CsvAgent(BaseAgent):
                  validation_service: ValidationService,
                  settings: Settings,
                  csv_processor: CSVProcessor):
+        # Set before BaseAgent pre-renders the prompt with the CSV headers
+        self.csv_processor = csv_processor
         super().__init__(AgentType.CSV, prompt_manager,
                          llm_service, validation_service, settings)
-        self.csv_processor = csv_processor
 
     def get_system_prompt_name(self) -> str:
         """Get the name of the system prompt template"""
@@ -35,9 +36,9 @@ class CsvAgent(BaseAgent):
         """Get the name of the output schema"""
         return "csv_test_case_schema"
 
-    def build_prompt_variables(self, input_data: AgentInput) -> Dict[str, Any]:
-        """Build variables for prompt template rendering"""
-        base_variables = super().build_prompt_variables(input_data)
+    def get_constant_prompt_variables(self) -> Dict[str, Any]:
+        """Get prompt variables that are the same for every section"""
+        base_variables = super().get_constant_prompt_variables()
 
         # Add CSV-specific variables
         csv_variables = {
@@ -60,16 +61,17 @@ class CsvAgent(BaseAgent):
             output_directory = input_data.agent_config.get("output_directory")
 
             # Generate CSV file using processor with proper output directory
-            csv_file_path = await self.csv_processor.generate_csv_file(
+            csv_file_path, row_count, headers_ok = await self.csv_processor.generate_csv_file(
                 test_cases=test_cases,
                 section_id=input_data.section.section_id,
                 headers=metadata.get(
                     "csv_headers", self.csv_processor.get_default_headers()),
-                output_directory=output_directory
+                output_directory=output_directory,
+                timestamp=input_data.agent_config.get("run_timestamp")
             )
 
-            # Validate the generated CSV
-            is_valid = await self.csv_processor.validate_csv_output(csv_file_path)
+            # Validate the generated CSV from the processor's write results
+            is_valid = headers_ok and row_count > 0
             if not is_valid:
                 self.logger.warning("Generated CSV file failed validation")
 
@@ -88,9 +90,9 @@ class CsvAgent(BaseAgent):
                     "test_distribution": metadata.get("test_distribution", {}),
                     "validation_passed": is_valid,
                     "section_name": input_data.section.name,
-                    "endpoints_processed": len(input_data.section.endpoints),
+                    "endpoints_processed": input_data.section.endpoint_count,
                     "output_directory": str(output_directory) if output_directory else None,
-                    "model_used": self.get_model_for_agent()
+                    "model_used": self._agent_model
                 }
             )
 
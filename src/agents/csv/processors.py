@@ -1,15 +1,121 @@
 """CSV processing logic separated from agent implementation"""
+import asyncio
 import csv
-import json
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import orjson
 
 from src.config.dependencies import inject
 from src.config.settings import Settings
 from src.services.export_service import ExportService
 from src.utils.logger import get_logger
 
+# Test case field and default value behind each plain CSV header
+_CSV_HEADER_FIELDS = {
+    "Test Case ID": ("test_case_id", ""),
+    "Test Case Name": ("test_case_name", ""),
+    "Test Case Description": ("test_case_description", ""),
+    "Module": ("module", "API Tests"),
+    "Test Type": ("test_type", "Functional"),
+    "Priority": ("priority", "Medium"),
+    "Estimated Time (mins)": ("estimated_time", "15"),
+    "Preconditions": ("preconditions", ""),
+    "Expected Results": ("expected_results", ""),
+    "Tags": ("tags", "")
+}
+
+# Default CSV headers for QMetry import, in column order
+_DEFAULT_CSV_HEADERS = (
+    "Test Case ID",
+    "Test Case Name",
+    "Test Case Description",
+    "Module",
+    "Test Type",
+    "Priority",
+    "Estimated Time (mins)",
+    "Preconditions",
+    "Test Steps",
+    "Expected Results",
+    "Test Data",
+    "Tags"
+)
+
+# Headers every generated CSV must contain for QMetry import
+_REQUIRED_CSV_HEADERS = (
+    "Test Case ID", "Test Case Name", "Test Steps", "Expected Results")
+
+
+def _format_test_data_value(value: Any) -> str:
+    """Format a single test data value, encoding nested structures as JSON"""
+    if isinstance(value, (dict, list)):
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS, default=str).decode()
+    return str(value)
+
+
+def _format_test_steps(test_steps: Any) -> str:
+    """Format test steps for CSV (handle multiline)"""
+    if isinstance(test_steps, list):
+        # Join list items with numbered steps
+        return "\n".join(f"{i}. {step}" for i, step in enumerate(test_steps, 1))
+
+    # Line breaks are kept as is
+    return str(test_steps)
+
+
+def _format_test_data(test_data: Any) -> str:
+    """Format test data for CSV"""
+    if isinstance(test_data, dict):
+        # Convert dict to readable format
+        return "\n".join(
+            f"{key}: {_format_test_data_value(value)}"
+            for key, value in test_data.items()
+        )
+    elif isinstance(test_data, list):
+        return "\n".join(_format_test_data_value(item) for item in test_data)
+
+    return str(test_data)
+
+
+def _build_field_getter(header: str) -> Callable[[Dict[str, Any]], str]:
+    """Build the getter producing one header's cell from a test case"""
+    if header == "Test Steps":
+        return lambda test_case: _format_test_steps(test_case.get("test_steps", ""))
+    if header == "Test Data":
+        return lambda test_case: _format_test_data(test_case.get("test_data", ""))
+
+    field = _CSV_HEADER_FIELDS.get(header)
+    if field is None:
+        return lambda test_case: ""
+
+    # Schema violations are only logged, so non-string values are still
+    # coerced with str() as before; strings are written as is
+    field_name, default = field
+
+    def get_field(test_case: Dict[str, Any]) -> str:
+        value = test_case.get(field_name, default)
+        return value if isinstance(value, str) else str(value)
+
+    return get_field
+
+
+# Field getters per header order; they hold no processor state, so the plans
+# are shared by every processor in the process
+_ROW_PLANS: Dict[Tuple[str, ...], List[Callable[[Dict[str, Any]], str]]] = {
+    _DEFAULT_CSV_HEADERS: [_build_field_getter(header) for header in _DEFAULT_CSV_HEADERS]
+}
+
+
+def _get_row_plan(headers: List[str]) -> List[Callable[[Dict[str, Any]], str]]:
+    """Get the field getters for a header order, building them once per process"""
+    key = tuple(headers)
+    row_plan = _ROW_PLANS.get(key)
+    if row_plan is None:
+        row_plan = [_build_field_getter(header) for header in headers]
+        _ROW_PLANS[key] = row_plan
+    return row_plan
+
 
 class CSVProcessor:
     """Handles CSV-specific processing logic"""
@@ -25,29 +131,36 @@ class CSVProcessor:
         test_cases: List[Dict[str, Any]],
         section_id: str,
         headers: List[str],
-        output_directory: Path = None
-    ) -> Path:
-        """Generate CSV file from test cases using specified output directory"""
+        output_directory: Path = None,
+        timestamp: Optional[str] = None
+    ) -> Tuple[Path, int, bool]:
+        """Generate CSV file from test cases, returning its path, row count and header check"""
         try:
             # Use provided output directory or fall back to settings
-            base_output_dir = output_directory or self.settings.output_directory
+            csv_dir = Path(output_directory or self.settings.output_directory) / "csv"
 
             # Create output path with proper directory structure
-            timestamp = self._get_timestamp()
+            # Use the run's timestamp so all CSVs of a run share it
+            timestamp = timestamp or self._get_timestamp()
             filename = f"test_cases_{section_id}_{timestamp}.csv"
-            output_path = base_output_dir / "csv" / filename
+            output_path = csv_dir / filename
 
-            # Convert test cases to CSV format
-            csv_rows = []
-            for test_case in test_cases:
-                row = self._test_case_to_csv_row(test_case, headers)
-                csv_rows.append(dict(zip(headers, row)))
+            # Convert test cases to positional CSV rows as they are written
+            row_plan = _get_row_plan(headers)
+            csv_rows = (
+                [getter(test_case) for getter in row_plan]
+                for test_case in test_cases
+            )
 
             # Export using export service
-            result_path = await self.export_service.export_csv(csv_rows, output_path, headers)
+            result_path = await self.export_service.export_csv_rows(csv_rows, output_path, headers)
 
-            self.logger.info(f"✅ CSV file generated: {result_path}")
-            return result_path
+            # Validate from the rows just written instead of re-reading the file
+            row_count = len(test_cases)
+            headers_ok = self._has_required_headers(headers)
+
+            self.logger.info(f"✅ CSV file generated: {result_path} ({row_count} test cases)")
+            return result_path, row_count, headers_ok
 
         except Exception as e:
             self.logger.error(f"CSV generation failed: {e}")
@@ -55,77 +168,30 @@ class CSVProcessor:
 
     def get_default_headers(self) -> List[str]:
         """Get default CSV headers for QMetry import"""
-        return [
-            "Test Case ID",
-            "Test Case Name",
-            "Test Case Description",
-            "Module",
-            "Test Type",
-            "Priority",
-            "Estimated Time (mins)",
-            "Preconditions",
-            "Test Steps",
-            "Expected Results",
-            "Test Data",
-            "Tags"
-        ]
-
-    def _test_case_to_csv_row(self, test_case: Dict[str, Any], headers: List[str]) -> List[str]:
-        """Convert test case dictionary to CSV row"""
-        # Field mapping for flexible header handling
-        field_mapping = {
-            "Test Case ID": test_case.get("test_case_id", ""),
-            "Test Case Name": test_case.get("test_case_name", ""),
-            "Test Case Description": test_case.get("test_case_description", ""),
-            "Module": test_case.get("module", "API Tests"),
-            "Test Type": test_case.get("test_type", "Functional"),
-            "Priority": test_case.get("priority", "Medium"),
-            "Estimated Time (mins)": test_case.get("estimated_time", "15"),
-            "Preconditions": test_case.get("preconditions", ""),
-            "Test Steps": self._format_test_steps(test_case.get("test_steps", "")),
-            "Expected Results": test_case.get("expected_results", ""),
-            "Test Data": self._format_test_data(test_case.get("test_data", "")),
-            "Tags": test_case.get("tags", "")
-        }
-
-        # Build row according to header order
-        row = []
-        for header in headers:
-            value = field_mapping.get(header, "")
-            row.append(str(value))
-
-        return row
-
-    def _format_test_steps(self, test_steps: Any) -> str:
-        """Format test steps for CSV (handle multiline)"""
-        if isinstance(test_steps, list):
-            # Join list items with numbered steps
-            formatted_steps = []
-            for i, step in enumerate(test_steps, 1):
-                formatted_steps.append(f"{i}. {step}")
-            return "\n".join(formatted_steps)
-
-        return str(test_steps).replace('\n', '\n')  # Preserve line breaks
-
-    def _format_test_data(self, test_data: Any) -> str:
-        """Format test data for CSV"""
-        if isinstance(test_data, dict):
-            # Convert dict to readable format
-            formatted_data = []
-            for key, value in test_data.items():
-                formatted_data.append(f"{key}: {value}")
-            return "\n".join(formatted_data)
-        elif isinstance(test_data, list):
-            return "\n".join(str(item) for item in test_data)
-
-        return str(test_data)
+        return list(_DEFAULT_CSV_HEADERS)
 
     def _get_timestamp(self) -> str:
         """Get timestamp for filename"""
         return datetime.now().strftime("%Y%m%d_%H%M%S")
 
-    async def validate_csv_output(self, csv_file_path: Path) -> bool:
-        """Validate generated CSV file"""
+    def _has_required_headers(self, headers: List[str]) -> bool:
+        """Check that the required QMetry headers are present"""
+        missing_headers = [
+            h for h in _REQUIRED_CSV_HEADERS if h not in headers]
+
+        if missing_headers:
+            self.logger.error(
+                f"Missing required headers: {missing_headers}")
+            return False
+        return True
+
+    async def validate_existing_csv(self, csv_file_path: Path) -> bool:
+        """Validate a CSV file on disk, such as one not generated in this run"""
+        # Read the file in a worker thread so the event loop is not blocked
+        return await asyncio.to_thread(self._validate_csv_file, csv_file_path)
+
+    def _validate_csv_file(self, csv_file_path: Path) -> bool:
+        """Check a CSV file's headers and row count"""
         try:
             if not csv_file_path.exists():
                 self.logger.error(f"CSV file does not exist: {csv_file_path}")
@@ -146,18 +212,13 @@ class CSVProcessor:
                     return False
 
                 # Check required headers are present
-                required_headers = [
-                    "Test Case ID", "Test Case Name", "Test Steps", "Expected Results"]
-                missing_headers = [
-                    h for h in required_headers if h not in headers]
-
-                if missing_headers:
-                    self.logger.error(
-                        f"Missing required headers: {missing_headers}")
+                if not self._has_required_headers(headers):
                     return False
 
-                # Count rows
-                row_count = sum(1 for row in reader)
+                # Count rows, falling back to the reader when quoted fields may span lines
+                row_count = self._count_unquoted_csv_rows(csv_file_path)
+                if row_count is None:
+                    row_count = sum(1 for row in reader)
                 if row_count == 0:
                     self.logger.error("CSV file has no test cases")
                     return False
@@ -169,3 +230,15 @@ class CSVProcessor:
         except Exception as e:
             self.logger.error(f"CSV validation failed: {e}")
             return False
+
+    def _count_unquoted_csv_rows(self, csv_file_path: Path) -> Optional[int]:
+        """Count data rows by newlines, or None if the file has quoted fields"""
+        content = csv_file_path.read_bytes()
+        if b'"' in content:
+            return None
+
+        line_count = content.count(b"\n")
+        if not content.endswith(b"\n"):
+            line_count += 1
+        # Exclude the header line
+        return line_count - 1
@@ -1,5 +1,16 @@
 """CSV agent specific schemas"""
 
+from src.agents.base.schemas import (
+    STRING_SCHEMA,
+    BOOLEAN_SCHEMA,
+    NON_NEGATIVE_INTEGER_SCHEMA
+)
+
+# Allowed test case types and priorities, shared by every schema reference
+TEST_TYPES = ["Functional", "Integration", "Negative",
+              "Security", "Performance", "Boundary"]
+PRIORITY_LEVELS = ["High", "Medium", "Low"]
+
 # Main schema for CSV test case generation
 CSV_TEST_CASE_SCHEMA = {
     "type": "object",
@@ -28,12 +39,12 @@ CSV_TEST_CASE_SCHEMA = {
                     },
                     "test_type": {
                         "type": "string",
-                        "enum": ["Functional", "Integration", "Negative", "Security", "Performance", "Boundary"],
+                        "enum": TEST_TYPES,
                         "description": "Type of test case based on testing approach"
                     },
                     "priority": {
                         "type": "string",
-                        "enum": ["High", "Medium", "Low"],
+                        "enum": PRIORITY_LEVELS,
                         "description": "Test case priority based on business criticality"
                     },
                     "estimated_time": {
@@ -92,18 +103,18 @@ CSV_TEST_CASE_SCHEMA = {
                 },
                 "csv_headers": {
                     "type": "array",
-                    "items": {"type": "string"},
+                    "items": STRING_SCHEMA,
                     "description": "CSV column headers to use for export"
                 },
                 "test_distribution": {
                     "type": "object",
                     "properties": {
-                        "functional": {"type": "integer", "minimum": 0},
-                        "integration": {"type": "integer", "minimum": 0},
-                        "negative": {"type": "integer", "minimum": 0},
-                        "security": {"type": "integer", "minimum": 0},
-                        "performance": {"type": "integer", "minimum": 0},
-                        "boundary": {"type": "integer", "minimum": 0}
+                        "functional": NON_NEGATIVE_INTEGER_SCHEMA,
+                        "integration": NON_NEGATIVE_INTEGER_SCHEMA,
+                        "negative": NON_NEGATIVE_INTEGER_SCHEMA,
+                        "security": NON_NEGATIVE_INTEGER_SCHEMA,
+                        "performance": NON_NEGATIVE_INTEGER_SCHEMA,
+                        "boundary": NON_NEGATIVE_INTEGER_SCHEMA
                     },
                     "required": ["functional", "integration", "negative", "security", "performance", "boundary"],
                     "additionalProperties": False,
@@ -112,12 +123,12 @@ CSV_TEST_CASE_SCHEMA = {
                 "coverage_analysis": {
                     "type": "object",
                     "properties": {
-                        "endpoints_covered": {"type": "integer", "minimum": 0},
-                        "total_endpoints": {"type": "integer", "minimum": 0},
+                        "endpoints_covered": NON_NEGATIVE_INTEGER_SCHEMA,
+                        "total_endpoints": NON_NEGATIVE_INTEGER_SCHEMA,
                         "coverage_percentage": {"type": "number", "minimum": 0, "maximum": 100},
                         "uncovered_areas": {
                             "type": "array",
-                            "items": {"type": "string"},
+                            "items": STRING_SCHEMA,
                             "description": "Areas that may need additional test coverage"
                         }
                     },
@@ -129,8 +140,8 @@ CSV_TEST_CASE_SCHEMA = {
                     "type": "object",
                     "properties": {
                         "avg_steps_per_test": {"type": "number", "minimum": 1},
-                        "detailed_test_data_count": {"type": "integer", "minimum": 0},
-                        "validation_points_count": {"type": "integer", "minimum": 0}
+                        "detailed_test_data_count": NON_NEGATIVE_INTEGER_SCHEMA,
+                        "validation_points_count": NON_NEGATIVE_INTEGER_SCHEMA
                     },
                     "required": ["avg_steps_per_test", "detailed_test_data_count", "validation_points_count"],
                     "additionalProperties": False,
@@ -145,6 +156,12 @@ CSV_TEST_CASE_SCHEMA = {
     "additionalProperties": False
 }
 
+# Single test case schema, for validating test cases one at a time
+CSV_TEST_CASE_ITEM_SCHEMA = CSV_TEST_CASE_SCHEMA["properties"]["test_cases"]["items"]
+
+# Fields every generated test case must carry, for set-based missing-key checks
+CSV_TEST_CASE_REQUIRED = frozenset(CSV_TEST_CASE_ITEM_SCHEMA["required"])
+
 # Schema for CSV validation
 CSV_VALIDATION_SCHEMA = {
     "type": "object",
@@ -161,14 +178,14 @@ CSV_VALIDATION_SCHEMA = {
         "header_validation": {
             "type": "object",
             "properties": {
-                "required_headers_present": {"type": "boolean"},
+                "required_headers_present": BOOLEAN_SCHEMA,
                 "missing_headers": {
                     "type": "array",
-                    "items": {"type": "string"}
+                    "items": STRING_SCHEMA
                 },
                 "extra_headers": {
                     "type": "array",
-                    "items": {"type": "string"}
+                    "items": STRING_SCHEMA
                 }
             },
             "required": ["required_headers_present", "missing_headers", "extra_headers"],
@@ -177,21 +194,21 @@ CSV_VALIDATION_SCHEMA = {
         "content_validation": {
             "type": "object",
             "properties": {
-                "empty_required_fields": {"type": "integer", "minimum": 0},
-                "malformed_test_steps": {"type": "integer", "minimum": 0},
-                "missing_test_data": {"type": "integer", "minimum": 0}
+                "empty_required_fields": NON_NEGATIVE_INTEGER_SCHEMA,
+                "malformed_test_steps": NON_NEGATIVE_INTEGER_SCHEMA,
+                "missing_test_data": NON_NEGATIVE_INTEGER_SCHEMA
             },
             "required": ["empty_required_fields", "malformed_test_steps", "missing_test_data"],
             "additionalProperties": False
         },
         "errors": {
             "type": "array",
-            "items": {"type": "string"},
+            "items": STRING_SCHEMA,
             "description": "Validation error messages"
         },
         "warnings": {
             "type": "array",
-            "items": {"type": "string"},
+            "items": STRING_SCHEMA,
             "description": "Validation warning messages"
         }
     },
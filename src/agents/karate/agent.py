@@ -1,6 +1,8 @@
 # src/agents/karate/agent.py
 """Karate Feature Generation Agent"""
-from typing import Any, Dict
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List
 
 from src.config.dependencies import inject
 from src.config.settings import Settings
@@ -14,9 +16,48 @@ from src.services.llm_service import LLMService
 from src.services.validation_service import ValidationService
 
 
+# Generated file suffixes reported as Karate data files
+_DATA_FILE_SUFFIXES = frozenset({'.json', '.csv', '.yaml'})
+
+
+@dataclass(slots=True)
+class _ParsedLLMOutput:
+    """Karate LLM output sections, read once from the raw response"""
+    feature_data: Dict[str, Any]
+    data_files_data: List[Dict[str, Any]]
+    metadata: Dict[str, Any]
+    scenarios: List[Dict[str, Any]]
+
+    @classmethod
+    def from_llm_output(cls, llm_output: Dict[str, Any]) -> "_ParsedLLMOutput":
+        """Extract the feature, data file and metadata sections"""
+        # Missing or null sections are treated as empty
+        feature_data = llm_output.get("feature_file") or {}
+        return cls(
+            feature_data=feature_data,
+            data_files_data=llm_output.get("data_files") or [],
+            metadata=llm_output.get("metadata") or {},
+            scenarios=feature_data.get("scenarios", [])
+        )
+
+
 class KarateAgent(BaseAgent):
     """Agent for generating professional Karate feature files"""
 
+    # Karate-specific prompt variables that do not depend on the section
+    _STATIC_PROMPT_VARIABLES = {
+        "framework_version": "1.4.x",
+        "test_patterns": ["happy_path", "validation", "error_handling", "edge_cases"],
+        "karate_features": ["data_driven", "scenario_outline", "background", "conditional_logic"],
+        "assertion_types": ["status", "header", "response_time", "schema", "content"],
+        "variable_scoping": ["feature", "scenario", "call"],
+        "data_file_formats": ["json", "csv", "yaml"],
+        "include_setup_teardown": False,
+        "include_examples": True,
+        "best_practices": True,
+        "comprehensive_scenarios": True
+    }
+
     @inject
     def __init__(self,
                  prompt_manager: PromptManager,
@@ -27,6 +68,16 @@ class KarateAgent(BaseAgent):
         super().__init__(AgentType.KARATE, prompt_manager,
                          llm_service, validation_service, settings)
         self.karate_processor = karate_processor
+        # Output metadata in report order; only the per-section values change per call
+        self._metadata_template = dict.fromkeys((
+            "feature_title", "validation_passed", "section_name", "endpoints_processed",
+            "test_coverage", "karate_version", "execution_requirements",
+            "framework_features_used", "documentation_generated", "documentation_path",
+            "output_directory", "scenarios_expected", "scenarios_generated",
+            "scenario_coverage_ratio", "model_used"
+        ))
+        self._metadata_template["karate_version"] = "1.4.x"
+        self._metadata_template["model_used"] = self._agent_model
 
     def get_system_prompt_name(self) -> str:
         """Get the name of the system prompt template"""
@@ -36,6 +87,11 @@ class KarateAgent(BaseAgent):
         """Get the name of the output schema"""
         return "karate_feature_schema"
 
+    def get_constant_prompt_variables(self) -> Dict[str, Any]:
+        """Get prompt variables that are the same for every section"""
+        base_variables = super().get_constant_prompt_variables()
+        return {**base_variables, **self._STATIC_PROMPT_VARIABLES}
+
     def build_prompt_variables(self, input_data: AgentInput) -> Dict[str, Any]:
         """Build variables for prompt template rendering"""
         base_variables = super().build_prompt_variables(input_data)
@@ -43,19 +99,9 @@ class KarateAgent(BaseAgent):
         # Add Karate-specific variables with emphasis on comprehensive scenario generation
         karate_variables = {
             "feature_name": f"{input_data.section.name} API Tests",
-            "framework_version": "1.4.x",
-            "test_patterns": ["happy_path", "validation", "error_handling", "edge_cases"],
-            "karate_features": ["data_driven", "scenario_outline", "background", "conditional_logic"],
-            "assertion_types": ["status", "header", "response_time", "schema", "content"],
-            "variable_scoping": ["feature", "scenario", "call"],
-            "data_file_formats": ["json", "csv", "yaml"],
             "include_documentation": input_data.agent_config.get("generate_karate_docs", True),
-            "include_setup_teardown": False,
-            "include_examples": True,
-            "best_practices": True,
-            "comprehensive_scenarios": True,
-            "scenario_requirement": f"Generate AT LEAST {len(input_data.section.test_cases)} scenarios - one for each test case plus additional edge cases",
-            "endpoint_coverage": f"Ensure all {len(input_data.section.endpoints)} endpoints have comprehensive test coverage"
+            "scenario_requirement": f"Generate AT LEAST {input_data.section.test_case_count} scenarios - one for each test case plus additional edge cases",
+            "endpoint_coverage": f"Ensure all {input_data.section.endpoint_count} endpoints have comprehensive test coverage"
         }
 
         return {**base_variables, **karate_variables}
@@ -63,30 +109,30 @@ class KarateAgent(BaseAgent):
     async def process_llm_output(self, llm_output: Dict[str, Any], input_data: AgentInput) -> KarateOutput:
         """Process LLM output into Karate feature files"""
         try:
-            feature_data = llm_output.get("feature_file", {})
-            data_files_data = llm_output.get("data_files", [])
-            metadata = llm_output.get("metadata", {})
+            parsed = _ParsedLLMOutput.from_llm_output(llm_output)
+            feature_data = parsed.feature_data
+            metadata = parsed.metadata
 
-            self.logger.debug(
-                f"Feature data keys: {list(feature_data.keys()) if isinstance(feature_data, dict) else 'Not a dict'}")
-            self.logger.debug(
-                f"Data files count: {len(data_files_data) if isinstance(data_files_data, list) else 'Not a list'}")
-            self.logger.debug(
-                f"Metadata keys: {list(metadata.keys()) if isinstance(metadata, dict) else 'Not a dict'}")
+            debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+            if debug_enabled:
+                self.logger.debug(
+                    "Feature data keys: %s, data files count: %d, metadata keys: %s",
+                    feature_data.keys(), len(parsed.data_files_data), metadata.keys())
 
             # Debug scenarios specifically
-            scenarios = feature_data.get("scenarios", [])
-            expected_scenarios = len(input_data.section.test_cases)
+            scenarios = parsed.scenarios
+            scenario_count = len(scenarios)
+            expected_scenarios = input_data.section.test_case_count
 
-            self.logger.info(f"LLM generated {len(scenarios)} scenarios")
+            self.logger.info(f"LLM generated {scenario_count} scenarios")
             self.logger.info(
                 f"Expected at least {expected_scenarios} scenarios based on test cases")
 
-            if scenarios:
+            if debug_enabled and scenarios:
                 # Log first 3 scenario names
-                for i, scenario in enumerate(scenarios[:3]):
+                for i in range(min(3, scenario_count)):
                     self.logger.debug(
-                        f"Scenario {i+1}: {scenario.get('name', 'Unnamed scenario')}")
+                        "Scenario %d: %s", i + 1, scenarios[i].get('name', 'Unnamed scenario'))
 
             # Debug metadata totals
             self.logger.info(
@@ -104,7 +150,7 @@ class KarateAgent(BaseAgent):
             # Generate feature file using processor with conditional documentation and proper output directory
             generated_files = await self.karate_processor.generate_feature_files(
                 feature_data=feature_data,
-                data_files_data=data_files_data,
+                data_files_data=parsed.data_files_data,
                 section_id=input_data.section.section_id,
                 metadata=metadata,
                 generate_docs=generate_docs,
@@ -122,37 +168,45 @@ class KarateAgent(BaseAgent):
             if generate_docs and "documentation" in generated_files:
                 documentation_file = str(generated_files["documentation"])
 
+            # Convert Paths to strings and pick out data files in one pass
+            artifacts = []
+            data_files = []
+            for path in generated_files.values():
+                path_str = str(path)
+                artifacts.append(path_str)
+                if path.suffix in _DATA_FILE_SUFFIXES:
+                    data_files.append(path_str)
+
+            output_metadata = self._metadata_template.copy()
+            output_metadata.update(
+                feature_title=feature_data.get("feature_title", ""),
+                validation_passed=is_valid,
+                section_name=input_data.section.name,
+                endpoints_processed=input_data.section.endpoint_count,
+                test_coverage=metadata.get("test_coverage", {}),
+                execution_requirements=metadata.get("execution_requirements", {}),
+                framework_features_used=metadata.get("framework_features_used", []),
+                documentation_generated=generate_docs,
+                documentation_path=documentation_file if generate_docs else None,
+                output_directory=str(output_directory) if output_directory else None,
+                scenarios_expected=expected_scenarios,
+                scenarios_generated=scenario_count,
+                scenario_coverage_ratio=scenario_count / max(expected_scenarios, 1)
+            )
+
             return KarateOutput(
                 agent_type=self.agent_type,
                 section_id=input_data.section.section_id,
                 success=True,
-                # Convert Path to string
-                artifacts=[str(path) for path in generated_files.values()],
-                feature_files=[str(generated_files.get("feature", ""))],
-                data_files=[str(path) for path in generated_files.values() if str(
-                    path).endswith(('.json', '.csv', '.yaml'))],
-                scenario_count=metadata.get("total_scenarios", len(scenarios)),
+                artifacts=artifacts,
+                feature_files=[str(feature_file or "")],
+                data_files=data_files,
+                scenario_count=metadata.get("total_scenarios", scenario_count),
                 background_steps=metadata.get("background_steps", []),
                 variables_used=metadata.get("variables_used", []),
                 data_driven_scenarios=metadata.get("data_driven_count", 0),
                 documentation_file=documentation_file,
-                metadata={
-                    "feature_title": feature_data.get("feature_title", ""),
-                    "validation_passed": is_valid,
-                    "section_name": input_data.section.name,
-                    "endpoints_processed": len(input_data.section.endpoints),
-                    "test_coverage": metadata.get("test_coverage", {}),
-                    "karate_version": "1.4.x",
-                    "execution_requirements": metadata.get("execution_requirements", {}),
-                    "framework_features_used": metadata.get("framework_features_used", []),
-                    "documentation_generated": generate_docs,
-                    "documentation_path": documentation_file if generate_docs else None,
-                    "output_directory": str(output_directory) if output_directory else None,
-                    "scenarios_expected": expected_scenarios,
-                    "scenarios_generated": len(scenarios),
-                    "scenario_coverage_ratio": len(scenarios) / max(expected_scenarios, 1),
-                    "model_used": self.get_model_for_agent()
-                }
+                metadata=output_metadata
             )
 
         except Exception as e:
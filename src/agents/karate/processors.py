@@ -1,17 +1,263 @@
 # src/agents/karate/processors.py
 """Karate feature file processing logic"""
-import json
+import asyncio
+import io
 import yaml
 import re
+import aiofiles
+import orjson
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from src.config.dependencies import inject
 from src.config.settings import Settings
 from src.services.export_service import ExportService
 from src.utils.logger import get_logger
 
+# libyaml's C emitter when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+
+# Patterns used to turn feature titles into file names
+_API_TESTS_SUFFIX_RE = re.compile(r'\s+API\s+Tests?$', re.IGNORECASE)
+_NON_WORD_RE = re.compile(r'[^\w\s-]')
+_SEPARATOR_RE = re.compile(r'[-\s]+')
+
+# Removes every @ from a tag before the single prefix is added
+_STRIP_AT = str.maketrans('', '', '@')
+
+# Basic Karate syntax markers and what each one shows is present
+_FEATURE_CHECKS = (
+    ("Feature:", "Feature declaration"),
+    ("Scenario:", "At least one scenario"),
+    ("Given", "Setup steps"),
+    ("When", "Action steps"),
+    ("Then", "Assertion steps")
+)
+
+# Every marker, plus scenario outlines, found in a single scan of the feature file
+_FEATURE_MARKER_RE = re.compile(
+    r'Feature:|Scenario Outline:|Scenario:|Given|When|Then')
+
+
+# README overview, prerequisites and the start of the project tree
+_DOC_HEADER_TEMPLATE = """\
+# {feature_title} - Karate Feature Documentation
+
+This documentation provides comprehensive guidance for executing and understanding the generated Karate feature file.
+
+## Overview
+
+- **Feature**: {feature_title}
+- **Total Scenarios**: {total_scenarios}
+- **Data-Driven Scenarios**: {data_driven_count}
+- **Karate Version**: 1.4.x
+- **Generated**: {generated_at}
+
+## Prerequisites
+
+Before running these tests, ensure you have:
+
+1. **Java 8 or higher** installed
+2. **Karate framework 1.4.x** configured in your project
+3. **Maven** or **Gradle** build tool
+4. **API environment** accessible and running
+
+## Project Structure
+
+```
+src/test/java/
+├── features/
+│   ├── {feature_filename}
+│   └── data/
+"""
+
+# Project tree entries shown when the feature has data files
+_DOC_DATA_FILE_TREE = """\
+│       ├── test-data.json
+│       ├── validation-data.csv
+│       └── config-data.yaml
+"""
+
+# Rest of the project tree, configuration and runner setup; braces are escaped for str.format
+_DOC_CONFIGURATION_TEMPLATE = """\
+└── runners/
+    └── TestRunner.java
+```
+
+## Karate Configuration
+
+### 1. karate-config.js
+
+Create a `karate-config.js` file in your `src/test/java` directory:
+
+```javascript
+function fn() {{
+  var config = {{
+    baseUrl: 'https://api.example.com',
+    apiVersion: 'v1',
+    timeout: 30000,
+    retryInterval: 1000,
+    auth: {{
+      token: karate.properties['auth.token'],
+      apiKey: karate.properties['api.key']
+    }}
+  }};
+
+  // Environment-specific configuration
+  if (karate.env == 'dev') {{
+    config.baseUrl = 'https://dev-api.example.com';
+  }} else if (karate.env == 'staging') {{
+    config.baseUrl = 'https://staging-api.example.com';
+  }}
+
+  return config;
+}}
+```
+
+### 2. Test Runner
+
+Create a JUnit test runner:
+
+```java
+package runners;
+
+import com.intuit.karate.junit5.Karate;
+
+class TestRunner {{
+    
+    @Karate.Test
+    Karate testFeature() {{
+        return Karate.run("classpath:features/{feature_filename}");
+    }}
+}}
+```
+
+## Variables and Configuration
+
+### Global Variables
+
+The feature uses these configurable variables:
+
+"""
+
+# Environment variables and execution instructions
+_DOC_EXECUTION_GUIDE = """\
+
+### Environment Variables
+
+Set these system properties when running tests:
+
+```bash
+mvn test -Dkarate.env=dev -Dauth.token=your-token -Dapi.key=your-key
+```
+
+## Execution
+
+### Command Line
+
+```bash
+# Run all scenarios
+mvn test
+
+# Run specific environment
+mvn test -Dkarate.env=staging
+
+# Run with specific tags
+mvn test -Dkarate.options="--tags @smoke"
+
+# Run with custom properties
+mvn test -Dauth.token=abc123 -Dapi.key=xyz789
+```
+
+### IDE Execution
+
+1. Right-click on the feature file
+2. Select 'Run' or 'Debug'
+3. Configure environment variables in run configuration
+
+## Test Data
+
+"""
+
+# Troubleshooting and best practices, ending with the advanced features heading
+_DOC_TROUBLESHOOTING = """\
+## Troubleshooting
+
+### Common Issues
+
+1. **Connection Refused**
+   - Verify `baseUrl` is correct
+   - Ensure API server is running
+   - Check network connectivity
+
+2. **Authentication Errors**
+   - Verify `auth.token` is valid and not expired
+   - Check API key permissions
+   - Ensure correct authentication method
+
+3. **Schema Validation Failures**
+   - API response structure may have changed
+   - Check for new required fields
+   - Verify data types match expectations
+
+4. **Timeout Issues**
+   - Increase timeout values in karate-config.js
+   - Check API performance
+   - Consider retry mechanisms
+
+### Debug Mode
+
+Enable debug logging:
+
+```bash
+mvn test -Dkarate.options="--debug"
+```
+
+### Reporting
+
+Karate generates comprehensive HTML reports at:
+```
+target/karate-reports/
+```
+
+## Best Practices
+
+1. **Environment Management**: Use karate-config.js for environment-specific settings
+2. **Data Management**: Keep test data in separate files for maintainability
+3. **Assertion Strategy**: Use appropriate matchers for different validation scenarios
+4. **Error Handling**: Implement proper error scenarios and negative testing
+5. **Performance**: Monitor response times and set appropriate timeouts
+
+## Advanced Features Used
+
+"""
+
+# Features listed when the LLM reports none
+_DOC_DEFAULT_FEATURES = """\
+- **Scenario Outline**: Data-driven testing with examples
+- **Background**: Common setup steps
+- **Variable Substitution**: Dynamic value replacement
+- **JSON Path**: Flexible response validation
+- **Schema Validation**: Structure verification
+"""
+
+# Support links and generation footer; the README has no final newline
+_DOC_FOOTER_TEMPLATE = """\
+
+## Support
+
+For more information:
+- [Karate Documentation](https://github.com/karatelabs/karate)
+- [Karate DSL Reference](https://github.com/karatelabs/karate#syntax-guide)
+- [Best Practices Guide](https://github.com/karatelabs/karate/tree/master/examples)
+
+---
+*Generated by AI Test Orchestrator on {generated_at}*"""
 
 class KarateProcessor:
     """Handles Karate feature file processing and generation"""
@@ -48,74 +294,51 @@ class KarateProcessor:
             feature_title = feature_data.get("feature_title", section_id)
             clean_name = self._create_clean_filename(feature_title)
 
-            generated_files = {}
+            karate_dir = base_output_dir / "karate"
+            # One generation time shared by the feature file and its documentation
+            generated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
-            # Generate main feature file
-            feature_content = self._build_feature_content(
-                feature_data, metadata)
+            # Main feature file; its content is built below with the documentation
             feature_filename = f"{clean_name}.feature"
-            feature_path = base_output_dir / "karate" / feature_filename
+            feature_path = karate_dir / feature_filename
+            generated_files = {"feature": feature_path}
 
-            feature_file_path = await self.export_service.export_text(feature_content, feature_path)
-            generated_files["feature"] = feature_file_path
+            # Rendered data file contents, written together once everything is built
+            data_writes: List[Tuple[Path, Union[str, bytes]]] = []
 
             # Generate data files
             for i, data_file in enumerate(data_files_data):
-                # Handle both dict and string cases
-                if isinstance(data_file, dict):
-                    filename = data_file.get(
-                        "filename", f"{clean_name}_data_{i+1}.json")
-                    content_str = data_file.get("content", "{}")
-                elif isinstance(data_file, str):
-                    # If data_file is a string, create a simple structure
-                    filename = f"{clean_name}_data_{i+1}.json"
-                    content_str = data_file
-                else:
-                    self.logger.warning(
-                        f"Unexpected data_file type: {type(data_file)}")
+                rendered = self._render_data_file(data_file, f"{clean_name}_data_{i+1}.json")
+                if rendered is None:
                     continue
 
-                # Parse content string back to object if needed
-                try:
-                    if content_str.strip():
-                        content = json.loads(content_str)
-                    else:
-                        content = {}
-                except json.JSONDecodeError:
-                    # If not valid JSON, treat as plain text
-                    content = {"data": content_str}
-
-                # Determine file format and export accordingly
-                if filename.endswith('.json'):
-                    data_path = base_output_dir / "karate" / filename
-                    generated_files[f"data_{i+1}"] = await self.export_service.export_json(content, data_path)
-                elif filename.endswith('.csv'):
-                    # Convert JSON to CSV format if needed
-                    if isinstance(content, list) and content:
-                        headers = list(content[0].keys())
-                        data_path = base_output_dir / "karate" / filename
-                        generated_files[f"data_{i+1}"] = await self.export_service.export_csv(content, data_path, headers)
-                    else:
-                        # Create simple CSV from string content
-                        csv_data = [{"data": str(content)}]
-                        data_path = base_output_dir / "karate" / filename
-                        generated_files[f"data_{i+1}"] = await self.export_service.export_csv(csv_data, data_path, ["data"])
-                elif filename.endswith('.yaml') or filename.endswith('.yml'):
-                    if isinstance(content, str):
-                        yaml_content = content
-                    else:
-                        yaml_content = yaml.dump(
-                            content, default_flow_style=False, allow_unicode=True)
-                    data_path = base_output_dir / "karate" / filename
-                    generated_files[f"data_{i+1}"] = await self.export_service.export_text(yaml_content, data_path)
+                filename, file_content = rendered
+                data_path = karate_dir / filename
+                data_writes.append((data_path, file_content))
+                generated_files[f"data_{i+1}"] = data_path
+
+            # Build the feature and documentation text in worker threads so the
+            # event loop keeps serving other agents meanwhile
+            builds = [asyncio.to_thread(
+                self._build_feature_content, feature_data, metadata, generated_at)]
+            if generate_docs:
+                builds.append(asyncio.to_thread(
+                    self._generate_feature_documentation,
+                    feature_data, metadata, list(generated_files.keys()), generated_at))
+            feature_content, *doc_contents = await asyncio.gather(*builds)
+
+            writes = [(feature_path, feature_content), *data_writes]
 
             # Conditionally generate documentation file
             if generate_docs:
-                doc_content = self._generate_feature_documentation(
-                    feature_data, metadata, list(generated_files.keys()))
                 doc_filename = f"{clean_name}_README.md"
-                doc_path = base_output_dir / "karate" / doc_filename
-                generated_files["documentation"] = await self.export_service.export_text(doc_content, doc_path)
+                doc_path = karate_dir / doc_filename
+                writes.append((doc_path, doc_contents[0]))
+                generated_files["documentation"] = doc_path
+
+            await self.export_service.export_batch(writes)
+
+            if generate_docs:
                 self.logger.info(
                     f"✅ Generated Karate documentation: {doc_filename}")
             else:
@@ -132,48 +355,94 @@ class KarateProcessor:
             self.logger.error(f"Karate feature generation failed: {e}")
             raise
 
+    def _render_data_file(self,
+                          data_file: Any,
+                          default_filename: str) -> Optional[Tuple[str, Union[str, bytes]]]:
+        """Render one LLM data file entry, returning its filename and content or None to skip it"""
+        # Handle both dict and string cases
+        if isinstance(data_file, dict):
+            filename = data_file.get("filename", default_filename)
+            content_str = data_file.get("content", "{}")
+        elif isinstance(data_file, str):
+            # If data_file is a string, create a simple structure
+            filename = default_filename
+            content_str = data_file
+        else:
+            self.logger.warning(
+                f"Unexpected data_file type: {type(data_file)}")
+            return None
+
+        # Parse content string back to object if needed
+        try:
+            if content_str.strip():
+                content = orjson.loads(content_str)
+            else:
+                content = {}
+        except orjson.JSONDecodeError:
+            # If not valid JSON, treat as plain text
+            content = {"data": content_str}
+
+        # Determine file format and render accordingly
+        if filename.endswith('.json'):
+            return filename, self.export_service.render_json(content)
+        elif filename.endswith('.csv'):
+            # Convert JSON to CSV format if needed
+            if isinstance(content, list) and content:
+                headers = list(content[0].keys())
+                return filename, self.export_service.render_csv(content, headers)
+            # Create simple CSV from string content
+            csv_data = [{"data": str(content)}]
+            return filename, self.export_service.render_csv(csv_data, ["data"])
+        elif filename.endswith('.yaml') or filename.endswith('.yml'):
+            if isinstance(content, str):
+                return filename, content
+            return filename, yaml.dump(
+                content, Dumper=_YamlDumper, default_flow_style=False, allow_unicode=True)
+
+        return None
+
     def _create_clean_filename(self, name: str) -> str:
         """Create a clean filename from feature title or section name"""
         # Remove "API Tests" suffix if present
-        clean = re.sub(r'\s+API\s+Tests?$', '', name, flags=re.IGNORECASE)
+        clean = _API_TESTS_SUFFIX_RE.sub('', name)
         # Replace spaces and special characters with underscores
-        clean = re.sub(r'[^\w\s-]', '', clean)
-        clean = re.sub(r'[-\s]+', '_', clean)
+        clean = _NON_WORD_RE.sub('', clean)
+        clean = _SEPARATOR_RE.sub('_', clean)
         # Convert to lowercase and remove trailing underscores
         clean = clean.lower().strip('_')
         return clean if clean else "api_tests"
 
-    def _build_feature_content(self, feature_data: Dict[str, Any], metadata: Dict[str, Any]) -> str:
+    def _build_feature_content(self,
+                               feature_data: Dict[str, Any],
+                               metadata: Dict[str, Any],
+                               generated_at: str) -> str:
         """Build the complete Karate feature file content"""
-        lines = []
+        buf = io.StringIO()
+        w = buf.write
 
         # Feature header with documentation
         feature_title = feature_data.get("feature_title", "API Tests")
         feature_description = feature_data.get(
             "feature_description", "Comprehensive API testing scenarios")
 
-        lines.extend([
-            f"Feature: {feature_title}",
-            "",
-            f"  {feature_description}",
-            "",
-            "  # This feature file was generated by AI Test Orchestrator",
-            f"  # Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            "  # Framework: Karate DSL 1.4.x",
-            "  # Documentation: See accompanying README.md for setup and execution guidance",
-            ""
-        ])
+        w(f"Feature: {feature_title}\n")
+        w("\n")
+        w(f"  {feature_description}\n")
+        w("\n")
+        w("  # This feature file was generated by AI Test Orchestrator\n")
+        w(f"  # Generated on: {generated_at}\n")
+        w("  # Framework: Karate DSL 1.4.x\n")
+        w("  # Documentation: See accompanying README.md for setup and execution guidance\n")
+        w("\n")
 
         # Background section if present
         background = feature_data.get("background", [])
         if background:
-            lines.extend([
-                "  Background:",
-                "    # Common setup steps executed before each scenario"
-            ])
+            w("  Background:\n")
+            w("    # Common setup steps executed before each scenario\n")
             for step in background:
-                lines.append(f"    {step}")
-            lines.append("")
+                w(f"    {step}\n")
+            w("\n")
 
         # Scenarios
         scenarios = feature_data.get("scenarios", [])
@@ -183,16 +452,17 @@ class KarateProcessor:
         for i, scenario in enumerate(scenarios):
             self.logger.debug(
                 f"Processing scenario {i+1}: {scenario.get('name', 'Unnamed')}")
-            scenario_lines = self._build_scenario_content(scenario, i + 1)
-            lines.extend(scenario_lines)
-            lines.append("")  # Empty line between scenarios
-
-        return "\n".join(lines)
+            self._write_scenario_content(w, scenario, i + 1)
+            w("\n")  # Empty line between scenarios
 
-    def _build_scenario_content(self, scenario: Dict[str, Any], scenario_num: int) -> List[str]:
-        """Build content for a single scenario"""
-        lines = []
+        # Every line is written newline-terminated; the file has no final newline
+        return buf.getvalue()[:-1]
 
+    def _write_scenario_content(self,
+                                w: Callable[[str], Any],
+                                scenario: Dict[str, Any],
+                                scenario_num: int) -> None:
+        """Write the content for a single scenario"""
         scenario_name = scenario.get("name", f"Test Scenario {scenario_num}")
         scenario_description = scenario.get("description", "")
         tags = scenario.get("tags", [])
@@ -202,232 +472,101 @@ class KarateProcessor:
         # Tags - fix double @ issue
         if tags:
             # Remove any existing @ symbols and add single @ prefix
-            clean_tags = [tag.replace('@', '') for tag in tags]
-            tag_line = "  " + " ".join(f"@{tag}" for tag in clean_tags)
-            lines.append(tag_line)
+            clean_tags = [tag.translate(_STRIP_AT) for tag in tags]
+            w("  " + " ".join(f"@{tag}" for tag in clean_tags) + "\n")
 
         # Scenario or Scenario Outline
         if examples:
-            lines.append(f"  Scenario Outline: {scenario_name}")
+            w(f"  Scenario Outline: {scenario_name}\n")
         else:
-            lines.append(f"  Scenario: {scenario_name}")
+            w(f"  Scenario: {scenario_name}\n")
 
         # Description as comment
         if scenario_description:
-            lines.extend([
-                f"    # {scenario_description}",
-                ""
-            ])
+            w(f"    # {scenario_description}\n")
+            w("\n")
 
         # Steps
         for step in steps:
             # All steps are now simple strings
-            lines.append(f"    {step}")
+            w(f"    {step}\n")
 
         # Examples table for Scenario Outline
         if examples:
-            lines.extend([
-                "",
-                "    Examples:",
-                "      # Test data variations for this scenario outline"
-            ])
+            w("\n")
+            w("    Examples:\n")
+            w("      # Test data variations for this scenario outline\n")
 
             # Examples are provided as formatted strings - parse and format properly
-            if examples and not any("__" in ex for ex in examples):
-                # If examples look like table data, format them properly
-                for example_line in examples:
-                    if example_line.strip() and not example_line.startswith("#"):
-                        lines.append(f"      {example_line}")
+            # in a single pass, stopping at the first one that is not table data
+            example_rows = []
+            for example_line in examples:
+                if "__" in example_line:
+                    # Create a simple placeholder table
+                    w("      | parameter | value |\n")
+                    w("      | --------- | ----- |\n")
+                    w("      | testData  | value1 |\n")
+                    break
+                if example_line.strip() and not example_line.startswith("#"):
+                    example_rows.append(f"      {example_line}\n")
             else:
-                # Create a simple placeholder table
-                lines.extend([
-                    "      | parameter | value |",
-                    "      | --------- | ----- |",
-                    "      | testData  | value1 |"
-                ])
-
-        return lines
+                # Examples look like table data, so format them properly
+                w("".join(example_rows))
 
     def _generate_feature_documentation(
         self,
         feature_data: Dict[str, Any],
         metadata: Dict[str, Any],
-        generated_files: List[str]
+        generated_files: List[str],
+        generated_at: str
     ) -> str:
         """Generate comprehensive documentation for the feature file"""
         feature_title = feature_data.get("feature_title", "API Tests")
+        feature_filename = feature_data.get('filename', 'api-tests.feature')
+
+        buf = io.StringIO()
+        w = buf.write
 
-        doc_sections = [
-            f"# {feature_title} - Karate Feature Documentation",
-            "",
-            "This documentation provides comprehensive guidance for executing and understanding the generated Karate feature file.",
-            "",
-            "## Overview",
-            "",
-            f"- **Feature**: {feature_title}",
-            f"- **Total Scenarios**: {metadata.get('total_scenarios', 0)}",
-            f"- **Data-Driven Scenarios**: {metadata.get('data_driven_count', 0)}",
-            f"- **Karate Version**: 1.4.x",
-            f"- **Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            "",
-            "## Prerequisites",
-            "",
-            "Before running these tests, ensure you have:",
-            "",
-            "1. **Java 8 or higher** installed",
-            "2. **Karate framework 1.4.x** configured in your project",
-            "3. **Maven** or **Gradle** build tool",
-            "4. **API environment** accessible and running",
-            "",
-            "## Project Structure",
-            "",
-            "```",
-            "src/test/java/",
-            "├── features/",
-            f"│   ├── {feature_data.get('filename', 'api-tests.feature')}",
-            "│   └── data/",
-        ]
+        w(_DOC_HEADER_TEMPLATE.format(
+            feature_title=feature_title,
+            total_scenarios=metadata.get('total_scenarios', 0),
+            data_driven_count=metadata.get('data_driven_count', 0),
+            generated_at=generated_at,
+            feature_filename=feature_filename
+        ))
 
         # Document data files
         data_files = [f for f in generated_files if f.startswith('data_')]
         if data_files:
-            doc_sections.extend([
-                "│       ├── test-data.json",
-                "│       ├── validation-data.csv",
-                "│       └── config-data.yaml"
-            ])
-
-        doc_sections.extend([
-            "└── runners/",
-            "    └── TestRunner.java",
-            "```",
-            "",
-            "## Karate Configuration",
-            "",
-            "### 1. karate-config.js",
-            "",
-            "Create a `karate-config.js` file in your `src/test/java` directory:",
-            "",
-            "```javascript",
-            "function fn() {",
-            "  var config = {",
-            "    baseUrl: 'https://api.example.com',",
-            "    apiVersion: 'v1',",
-            "    timeout: 30000,",
-            "    retryInterval: 1000,",
-            "    auth: {",
-            "      token: karate.properties['auth.token'],",
-            "      apiKey: karate.properties['api.key']",
-            "    }",
-            "  };",
-            "",
-            "  // Environment-specific configuration",
-            "  if (karate.env == 'dev') {",
-            "    config.baseUrl = 'https://dev-api.example.com';",
-            "  } else if (karate.env == 'staging') {",
-            "    config.baseUrl = 'https://staging-api.example.com';",
-            "  }",
-            "",
-            "  return config;",
-            "}",
-            "```",
-            "",
-            "### 2. Test Runner",
-            "",
-            "Create a JUnit test runner:",
-            "",
-            "```java",
-            "package runners;",
-            "",
-            "import com.intuit.karate.junit5.Karate;",
-            "",
-            "class TestRunner {",
-            "    ",
-            "    @Karate.Test",
-            "    Karate testFeature() {",
-            f"        return Karate.run(\"classpath:features/{feature_data.get('filename', 'api-tests.feature')}\");",
-            "    }",
-            "}",
-            "```",
-            "",
-            "## Variables and Configuration",
-            "",
-            "### Global Variables",
-            "",
-            "The feature uses these configurable variables:",
-            ""
-        ])
+            w(_DOC_DATA_FILE_TREE)
+
+        w(_DOC_CONFIGURATION_TEMPLATE.format(feature_filename=feature_filename))
 
         # Document variables
         variables_used = metadata.get("variables_used", [])
         if variables_used:
-            doc_sections.append("| Variable | Description |")
-            doc_sections.append("|----------|-------------|")
-            for var in variables_used:
-                # Now variables_used is a list of strings
-                doc_sections.append(f"| `{var}` | Configuration variable |")
+            # Now variables_used is a list of strings
+            w("| Variable | Description |\n|----------|-------------|\n")
+            w("".join(f"| `{var}` | Configuration variable |\n" for var in variables_used))
         else:
-            doc_sections.append("- `baseUrl`: API base URL")
-            doc_sections.append("- `auth.token`: Authentication token")
-            doc_sections.append("- `api.version`: API version")
-
-        doc_sections.extend([
-            "",
-            "### Environment Variables",
-            "",
-            "Set these system properties when running tests:",
-            "",
-            "```bash",
-            "mvn test -Dkarate.env=dev -Dauth.token=your-token -Dapi.key=your-key",
-            "```",
-            "",
-            "## Execution",
-            "",
-            "### Command Line",
-            "",
-            "```bash",
-            "# Run all scenarios",
-            "mvn test",
-            "",
-            "# Run specific environment",
-            "mvn test -Dkarate.env=staging",
-            "",
-            "# Run with specific tags",
-            "mvn test -Dkarate.options=\"--tags @smoke\"",
-            "",
-            "# Run with custom properties",
-            "mvn test -Dauth.token=abc123 -Dapi.key=xyz789",
-            "```",
-            "",
-            "### IDE Execution",
-            "",
-            "1. Right-click on the feature file",
-            "2. Select 'Run' or 'Debug'",
-            "3. Configure environment variables in run configuration",
-            "",
-            "## Test Data",
-            "",
-        ])
+            w("- `baseUrl`: API base URL\n"
+              "- `auth.token`: Authentication token\n"
+              "- `api.version`: API version\n")
+
+        w(_DOC_EXECUTION_GUIDE)
 
         # Document data files if they exist
         if data_files:
-            doc_sections.extend([
-                "The feature uses external data files for data-driven testing:",
-                "",
-            ])
-            for i, data_file in enumerate(data_files, 1):
-                doc_sections.append(f"### Data File {i}")
-                doc_sections.append(
-                    f"- **Purpose**: Test variations and edge cases")
-                doc_sections.append(f"- **Format**: JSON/CSV/YAML")
-                doc_sections.append(
-                    f"- **Usage**: Referenced in Scenario Outline examples")
-                doc_sections.append("")
-
-        doc_sections.extend([
-            "## Scenario Documentation",
-            "",
-        ])
+            w("The feature uses external data files for data-driven testing:\n\n")
+            w("".join(
+                f"### Data File {i}\n"
+                "- **Purpose**: Test variations and edge cases\n"
+                "- **Format**: JSON/CSV/YAML\n"
+                "- **Usage**: Referenced in Scenario Outline examples\n\n"
+                for i in range(1, len(data_files) + 1)
+            ))
+
+        w("## Scenario Documentation\n\n")
 
         # Document each scenario
         scenarios = feature_data.get("scenarios", [])
@@ -437,100 +576,27 @@ class KarateProcessor:
                 "description", "No description available")
             tags = scenario.get("tags", [])
 
-            doc_sections.extend([
-                f"### {i}. {scenario_name}",
-                "",
-                f"**Description**: {scenario_desc}",
-                ""
-            ])
-
+            tag_block = ""
             if tags:
-                clean_tags = [tag.replace('@', '') for tag in tags]
-                doc_sections.append(
-                    f"**Tags**: {', '.join(f'@{tag}' for tag in clean_tags)}")
-                doc_sections.append("")
-
-        doc_sections.extend([
-            "## Troubleshooting",
-            "",
-            "### Common Issues",
-            "",
-            "1. **Connection Refused**",
-            "   - Verify `baseUrl` is correct",
-            "   - Ensure API server is running",
-            "   - Check network connectivity",
-            "",
-            "2. **Authentication Errors**",
-            "   - Verify `auth.token` is valid and not expired",
-            "   - Check API key permissions",
-            "   - Ensure correct authentication method",
-            "",
-            "3. **Schema Validation Failures**",
-            "   - API response structure may have changed",
-            "   - Check for new required fields",
-            "   - Verify data types match expectations",
-            "",
-            "4. **Timeout Issues**",
-            "   - Increase timeout values in karate-config.js",
-            "   - Check API performance",
-            "   - Consider retry mechanisms",
-            "",
-            "### Debug Mode",
-            "",
-            "Enable debug logging:",
-            "",
-            "```bash",
-            "mvn test -Dkarate.options=\"--debug\"",
-            "```",
-            "",
-            "### Reporting",
-            "",
-            "Karate generates comprehensive HTML reports at:",
-            "```",
-            "target/karate-reports/",
-            "```",
-            "",
-            "## Best Practices",
-            "",
-            "1. **Environment Management**: Use karate-config.js for environment-specific settings",
-            "2. **Data Management**: Keep test data in separate files for maintainability",
-            "3. **Assertion Strategy**: Use appropriate matchers for different validation scenarios",
-            "4. **Error Handling**: Implement proper error scenarios and negative testing",
-            "5. **Performance**: Monitor response times and set appropriate timeouts",
-            "",
-            "## Advanced Features Used",
-            "",
-        ])
+                clean_tags = [tag.translate(_STRIP_AT) for tag in tags]
+                tag_block = f"**Tags**: {', '.join(f'@{tag}' for tag in clean_tags)}\n\n"
+
+            # One write per scenario block
+            w(f"### {i}. {scenario_name}\n\n**Description**: {scenario_desc}\n\n{tag_block}")
+
+        w(_DOC_TROUBLESHOOTING)
 
         # Document framework features used
         framework_features = metadata.get("framework_features_used", [])
         if framework_features:
-            for feature in framework_features:
-                doc_sections.append(
-                    f"- **{feature}**: Advanced Karate DSL capability")
+            w("".join(
+                f"- **{feature}**: Advanced Karate DSL capability\n"
+                for feature in framework_features))
         else:
-            doc_sections.extend([
-                "- **Scenario Outline**: Data-driven testing with examples",
-                "- **Background**: Common setup steps",
-                "- **Variable Substitution**: Dynamic value replacement",
-                "- **JSON Path**: Flexible response validation",
-                "- **Schema Validation**: Structure verification"
-            ])
-
-        doc_sections.extend([
-            "",
-            "## Support",
-            "",
-            "For more information:",
-            "- [Karate Documentation](https://github.com/karatelabs/karate)",
-            "- [Karate DSL Reference](https://github.com/karatelabs/karate#syntax-guide)",
-            "- [Best Practices Guide](https://github.com/karatelabs/karate/tree/master/examples)",
-            "",
-            f"---",
-            f"*Generated by AI Test Orchestrator on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*"
-        ])
-
-        return "\n".join(doc_sections)
+            w(_DOC_DEFAULT_FEATURES)
+
+        w(_DOC_FOOTER_TEMPLATE.format(generated_at=generated_at))
+        return buf.getvalue()
 
     async def validate_feature_file(self, feature_file_path: Path) -> bool:
         """Validate the generated Karate feature file"""
@@ -540,27 +606,21 @@ class KarateProcessor:
                     f"Feature file does not exist: {feature_file_path}")
                 return False
 
-            # Read and basic validation
-            with open(feature_file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            # Read without blocking the event loop, then run basic validation
+            async with aiofiles.open(feature_file_path, 'r', encoding='utf-8') as f:
+                content = await f.read()
+
+            # Count every marker in one pass over the content
+            marker_counts = Counter(_FEATURE_MARKER_RE.findall(content))
 
             # Basic Karate syntax validation
-            validation_checks = [
-                ("Feature:", "Feature declaration"),
-                ("Scenario:", "At least one scenario"),
-                ("Given", "Setup steps"),
-                ("When", "Action steps"),
-                ("Then", "Assertion steps")
-            ]
-
-            for check, description in validation_checks:
-                if check not in content:
+            for check, description in _FEATURE_CHECKS:
+                if not marker_counts[check]:
                     self.logger.warning(
                         f"Missing {description} in feature file")
 
             # Count scenarios
-            scenario_count = content.count(
-                "Scenario:") + content.count("Scenario Outline:")
+            scenario_count = marker_counts["Scenario:"] + marker_counts["Scenario Outline:"]
             if scenario_count == 0:
                 self.logger.error("No scenarios found in feature file")
                 return False
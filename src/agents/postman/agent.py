@@ -17,6 +17,17 @@ from src.services.validation_service import ValidationService
 class PostmanAgent(BaseAgent):
     """Agent for generating professional Postman API collections"""
 
+    # Postman-specific prompt variables that do not depend on the section
+    _STATIC_PROMPT_VARIABLES = {
+        "api_version": "v1",  # Could be extracted from API spec
+        "environment_types": ["development", "staging", "production"],
+        "auth_methods": ["bearer", "apikey", "basic"],
+        "test_types": ["status_validation", "schema_validation", "data_extraction", "error_handling"],
+        "advanced_features": True,
+        "include_test_scripts": True,
+        "include_pre_request_scripts": True
+    }
+
     @inject
     def __init__(self,
                  prompt_manager: PromptManager,
@@ -36,24 +47,22 @@ class PostmanAgent(BaseAgent):
         """Get the name of the output schema"""
         return "postman_collection_schema"
 
+    def get_constant_prompt_variables(self) -> Dict[str, Any]:
+        """Get prompt variables that are the same for every section"""
+        base_variables = super().get_constant_prompt_variables()
+        return {**base_variables, **self._STATIC_PROMPT_VARIABLES}
+
     def build_prompt_variables(self, input_data: AgentInput) -> Dict[str, Any]:
         """Build variables for prompt template rendering"""
-        base_variables = super().build_prompt_variables(input_data)
-
-        # Add Postman-specific variables
-        postman_variables = {
-            "collection_name": f"{input_data.section.name} API Collection",
-            "api_version": "v1",  # Could be extracted from API spec
-            "environment_types": ["development", "staging", "production"],
-            "auth_methods": ["bearer", "apikey", "basic"],
-            "test_types": ["status_validation", "schema_validation", "data_extraction", "error_handling"],
-            "advanced_features": True,
-            "include_documentation": input_data.agent_config.get("generate_postman_docs", True),
-            "include_test_scripts": True,
-            "include_pre_request_scripts": True
-        }
-
-        return {**base_variables, **postman_variables}
+        variables = super().build_prompt_variables(input_data)
+
+        # Add Postman-specific variables to the fresh per-section dict; the
+        # static ones are already bound into the compiled system prompt
+        variables["collection_name"] = f"{input_data.section.name} API Collection"
+        variables["include_documentation"] = input_data.agent_config.get(
+            "generate_postman_docs", True)
+
+        return variables
 
     async def process_llm_output(self, llm_output: Dict[str, Any], input_data: AgentInput) -> PostmanOutput:
         """Process LLM output and add to consolidated collection"""
@@ -61,24 +70,29 @@ class PostmanAgent(BaseAgent):
             collection_data = llm_output.get("collection", {})
             environments_data = llm_output.get("environments", [])
             metadata = llm_output.get("metadata", {})
+            # Read once, then reported as both a count and a list
+            folder_structure = metadata.get("folder_structure", [])
+            section = input_data.section
+            agent_config = input_data.agent_config
+            # Reported in both the section and the output metadata
+            endpoint_count = section.endpoint_count
 
             # Add section-specific metadata
             section_metadata = {
                 **metadata,
-                "section_name": input_data.section.name,
-                "section_description": input_data.section.description,
-                "endpoints_processed": len(input_data.section.endpoints),
-                "model_used": self.get_model_for_agent()  # 🔥 Track which model was used
+                "section_name": section.name,
+                "section_description": section.description,
+                "endpoints_processed": endpoint_count,
+                "model_used": self._agent_model  # 🔥 Track which model was used
             }
 
             # Extract documentation generation flag from agent config
-            generate_docs = input_data.agent_config.get(
-                "generate_postman_docs", True)
+            generate_docs = agent_config.get("generate_postman_docs", True)
             self.logger.info(
                 f"Documentation generation: {'enabled' if generate_docs else 'disabled'}")
 
             # Extract output directory from agent config and set it on the processor
-            output_directory = input_data.agent_config.get("output_directory")
+            output_directory = agent_config.get("output_directory")
             if output_directory:
                 self.postman_processor.set_output_directory(output_directory)
                 self.logger.debug(
@@ -88,20 +102,20 @@ class PostmanAgent(BaseAgent):
             await self.postman_processor.generate_collection_files(
                 collection_data=collection_data,
                 environments_data=environments_data,
-                section_id=input_data.section.section_id,
+                section_id=section.section_id,
                 metadata=section_metadata
             )
 
             # Return output without file paths (files will be generated during finalization)
             return PostmanOutput(
                 agent_type=self.agent_type,
-                section_id=input_data.section.section_id,
+                section_id=section.section_id,
                 success=True,
                 artifacts=[],  # Will be populated during finalization
                 collection_file="",  # Will be set during finalization
                 environment_files=[],  # Will be set during finalization
                 request_count=metadata.get("total_requests", 0),
-                folder_count=len(metadata.get("folder_structure", [])),
+                folder_count=len(folder_structure),
                 auth_methods=metadata.get("auth_methods", []),
                 environment_count=len(environments_data),
                 has_tests=True,
@@ -109,18 +123,18 @@ class PostmanAgent(BaseAgent):
                 variables_count=len(collection_data.get("variable", [])),
                 documentation_file="",  # Will be set during finalization
                 is_consolidated=True,
-                section_folder_name=input_data.section.name,
+                section_folder_name=section.name,
                 metadata={
                     "collection_summary": metadata.get("collection_summary", ""),
-                    "folder_structure": metadata.get("folder_structure", []),
+                    "folder_structure": folder_structure,
                     "environment_variables": metadata.get("environment_variables", []),
                     "test_coverage": metadata.get("test_coverage", {}),
-                    "section_name": input_data.section.name,
-                    "endpoints_processed": len(input_data.section.endpoints),
+                    "section_name": section.name,
+                    "endpoints_processed": endpoint_count,
                     "consolidated": True,  # Flag to indicate this is part of a consolidated collection
                     "documentation_generation": generate_docs,
                     "output_directory": str(output_directory) if output_directory else None,
-                    "model_used": self.get_model_for_agent()
+                    "model_used": self._agent_model
                 }
             )
 
@@ -1,11 +1,12 @@
 # src/agents/postman/processors.py
 """Postman collection processing logic"""
-import json
 import re
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List
 
+import orjson
+
 from src.config.dependencies import inject
 from src.config.settings import Settings
 from src.services.export_service import ExportService
@@ -24,6 +25,7 @@ class PostmanProcessor:
         # Collection consolidation state
         self._consolidated_collection = None
         self._consolidated_environment = None
+        self._environment_keys = set()  # Keys already in the consolidated environment
         self._total_requests = 0
         self._all_folders = []
         self._api_name = "API"  # Will be set from first collection
@@ -49,6 +51,8 @@ class PostmanProcessor:
             # Update environment with any new variables (use first environment only)
             if environments_data and self._consolidated_environment is None:
                 self._consolidated_environment = environments_data[0]
+                self._environment_keys = {
+                    var["key"] for var in self._consolidated_environment.get("values", [])}
             elif environments_data:
                 self._merge_environment_variables(environments_data[0])
 
@@ -199,13 +203,15 @@ class PostmanProcessor:
         if not self._consolidated_environment:
             return
 
-        existing_keys = {var["key"]
-                         for var in self._consolidated_environment.get("values", [])}
+        # Keys are tracked as they are added, so duplicates collapse on insert
+        # without rescanning the consolidated values for every section
+        existing_keys = self._environment_keys
         new_values = new_env_data.get("values", [])
 
         for new_var in new_values:
             if new_var["key"] not in existing_keys:
                 self._consolidated_environment["values"].append(new_var)
+                existing_keys.add(new_var["key"])
                 self.logger.debug(
                     f"Added environment variable: {new_var['key']}")
 
@@ -362,13 +368,16 @@ class PostmanProcessor:
         return "\n".join(doc_sections)
 
     def _count_requests_in_items(self, items: List[Dict]) -> int:
-        """Count total requests in items recursively"""
+        """Count total requests in items, including those in nested folders"""
+        # Walk folders with an explicit stack instead of a call per folder level
         count = 0
-        for item in items:
-            if "request" in item:
-                count += 1
-            elif "item" in item:
-                count += self._count_requests_in_items(item["item"])
+        pending = [items]
+        while pending:
+            for item in pending.pop():
+                if "request" in item:
+                    count += 1
+                elif "item" in item:
+                    pending.append(item["item"])
         return count
 
     def _format_postman_collection(self, collection_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -398,8 +407,8 @@ class PostmanProcessor:
                 return False
 
             # Load and validate JSON structure
-            with open(collection_path, 'r', encoding='utf-8') as f:
-                collection = json.load(f)
+            with open(collection_path, 'rb') as f:
+                collection = orjson.loads(f.read())
 
             # Validate required Postman collection fields
             required_fields = ["info", "item"]
@@ -446,6 +455,7 @@ class PostmanProcessor:
         """Reset processor state for new collection generation"""
         self._consolidated_collection = None
         self._consolidated_environment = None
+        self._environment_keys = set()
         self._total_requests = 0
         self._all_folders = []
         self._api_name = "API"  # Reset to default
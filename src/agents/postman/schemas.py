@@ -1,6 +1,8 @@
 # src/agents/postman/schemas.py
 """Postman Collection Generation Schemas"""
 
+from src.agents.base.schemas import STRING_SCHEMA, BOOLEAN_SCHEMA
+
 POSTMAN_COLLECTION_SCHEMA = {
     "type": "object",
     "properties": {
@@ -24,10 +26,10 @@ POSTMAN_COLLECTION_SCHEMA = {
                     "items": {
                         "type": "object",
                         "properties": {
-                            "key": {"type": "string"},
-                            "value": {"type": "string"},
-                            "description": {"type": "string"},
-                            "type": {"type": "string"}
+                            "key": STRING_SCHEMA,
+                            "value": STRING_SCHEMA,
+                            "description": STRING_SCHEMA,
+                            "type": STRING_SCHEMA
                         },
                         "required": ["key", "value", "description", "type"],
                         "additionalProperties": False
@@ -47,9 +49,9 @@ POSTMAN_COLLECTION_SCHEMA = {
                             "items": {
                                 "type": "object",
                                 "properties": {
-                                    "key": {"type": "string"},
-                                    "value": {"type": "string"},
-                                    "type": {"type": "string"}
+                                    "key": STRING_SCHEMA,
+                                    "value": STRING_SCHEMA,
+                                    "type": STRING_SCHEMA
                                 },
                                 "required": ["key", "value", "type"],
                                 "additionalProperties": False
@@ -75,10 +77,10 @@ POSTMAN_COLLECTION_SCHEMA = {
                                 "properties": {
                                     "exec": {
                                         "type": "array",
-                                        "items": {"type": "string"},
+                                        "items": STRING_SCHEMA,
                                         "description": "JavaScript code lines"
                                     },
-                                    "type": {"type": "string"}
+                                    "type": STRING_SCHEMA
                                 },
                                 "required": ["exec", "type"],
                                 "additionalProperties": False
@@ -107,8 +109,8 @@ POSTMAN_COLLECTION_SCHEMA = {
                                 "items": {
                                     "type": "object",
                                     "properties": {
-                                        "name": {"type": "string"},
-                                        "description": {"type": "string"},
+                                        "name": STRING_SCHEMA,
+                                        "description": STRING_SCHEMA,
                                         "request": {
                                             "type": "object",
                                             "properties": {
@@ -121,10 +123,10 @@ POSTMAN_COLLECTION_SCHEMA = {
                                                     "items": {
                                                         "type": "object",
                                                         "properties": {
-                                                            "key": {"type": "string"},
-                                                            "value": {"type": "string"},
-                                                            "description": {"type": "string"},
-                                                            "disabled": {"type": "boolean"}
+                                                            "key": STRING_SCHEMA,
+                                                            "value": STRING_SCHEMA,
+                                                            "description": STRING_SCHEMA,
+                                                            "disabled": BOOLEAN_SCHEMA
                                                         },
                                                         "required": ["key", "value", "description", "disabled"],
                                                         "additionalProperties": False
@@ -133,24 +135,24 @@ POSTMAN_COLLECTION_SCHEMA = {
                                                 "url": {
                                                     "type": "object",
                                                     "properties": {
-                                                        "raw": {"type": "string"},
+                                                        "raw": STRING_SCHEMA,
                                                         "host": {
                                                             "type": "array",
-                                                            "items": {"type": "string"}
+                                                            "items": STRING_SCHEMA
                                                         },
                                                         "path": {
                                                             "type": "array",
-                                                            "items": {"type": "string"}
+                                                            "items": STRING_SCHEMA
                                                         },
                                                         "query": {
                                                             "type": "array",
                                                             "items": {
                                                                 "type": "object",
                                                                 "properties": {
-                                                                    "key": {"type": "string"},
-                                                                    "value": {"type": "string"},
-                                                                    "description": {"type": "string"},
-                                                                    "disabled": {"type": "boolean"}
+                                                                    "key": STRING_SCHEMA,
+                                                                    "value": STRING_SCHEMA,
+                                                                    "description": STRING_SCHEMA,
+                                                                    "disabled": BOOLEAN_SCHEMA
                                                                 },
                                                                 "required": ["key", "value", "description", "disabled"],
                                                                 "additionalProperties": False
@@ -161,9 +163,9 @@ POSTMAN_COLLECTION_SCHEMA = {
                                                             "items": {
                                                                 "type": "object",
                                                                 "properties": {
-                                                                    "key": {"type": "string"},
-                                                                    "value": {"type": "string"},
-                                                                    "description": {"type": "string"}
+                                                                    "key": STRING_SCHEMA,
+                                                                    "value": STRING_SCHEMA,
+                                                                    "description": STRING_SCHEMA
                                                                 },
                                                                 "required": ["key", "value", "description"],
                                                                 "additionalProperties": False
@@ -180,7 +182,7 @@ POSTMAN_COLLECTION_SCHEMA = {
                                                             "type": "string",
                                                             "enum": ["raw", "formdata", "urlencoded", "file", "graphql", "none"]
                                                         },
-                                                        "raw": {"type": "string"},
+                                                        "raw": STRING_SCHEMA,
                                                         "options": {
                                                             "type": "object",
                                                             "properties": {
@@ -203,7 +205,7 @@ POSTMAN_COLLECTION_SCHEMA = {
                                                     "required": ["mode", "raw", "options"],
                                                     "additionalProperties": False
                                                 },
-                                                "description": {"type": "string"}
+                                                "description": STRING_SCHEMA
                                             },
                                             "required": ["method", "header", "url", "body", "description"],
                                             "additionalProperties": False
@@ -213,14 +215,14 @@ POSTMAN_COLLECTION_SCHEMA = {
                                             "items": {
                                                 "type": "object",
                                                 "properties": {
-                                                    "name": {"type": "string"},
-                                                    "status": {"type": "string"},
+                                                    "name": STRING_SCHEMA,
+                                                    "status": STRING_SCHEMA,
                                                     "code": {"type": "integer"},
                                                     "header": {
                                                         "type": "array",
-                                                        "items": {"type": "string"}
+                                                        "items": STRING_SCHEMA
                                                     },
-                                                    "body": {"type": "string"}
+                                                    "body": STRING_SCHEMA
                                                 },
                                                 "required": ["name", "status", "code", "header", "body"],
                                                 "additionalProperties": False
@@ -241,9 +243,9 @@ POSTMAN_COLLECTION_SCHEMA = {
                                                         "properties": {
                                                             "exec": {
                                                                 "type": "array",
-                                                                "items": {"type": "string"}
+                                                                "items": STRING_SCHEMA
                                                             },
-                                                            "type": {"type": "string"}
+                                                            "type": STRING_SCHEMA
                                                         },
                                                         "required": ["exec", "type"],
                                                         "additionalProperties": False
@@ -284,10 +286,10 @@ POSTMAN_COLLECTION_SCHEMA = {
                         "items": {
                             "type": "object",
                             "properties": {
-                                "key": {"type": "string"},
-                                "value": {"type": "string"},
-                                "description": {"type": "string"},
-                                "enabled": {"type": "boolean"}
+                                "key": STRING_SCHEMA,
+                                "value": STRING_SCHEMA,
+                                "description": STRING_SCHEMA,
+                                "enabled": BOOLEAN_SCHEMA
                             },
                             "required": ["key", "value", "description", "enabled"],
                             "additionalProperties": False
@@ -314,7 +316,7 @@ POSTMAN_COLLECTION_SCHEMA = {
                 },
                 "folder_structure": {
                     "type": "array",
-                    "items": {"type": "string"},
+                    "items": STRING_SCHEMA,
                     "description": "List of folder names for organization"
                 },
                 "auth_methods": {
@@ -327,7 +329,7 @@ POSTMAN_COLLECTION_SCHEMA = {
                 },
                 "environment_variables": {
                     "type": "array",
-                    "items": {"type": "string"},
+                    "items": STRING_SCHEMA,
                     "description": "List of environment variable names"
                 },
                 "test_coverage": {
@@ -365,12 +367,12 @@ POSTMAN_COLLECTION_SCHEMA = {
                 "advanced_features": {
                     "type": "object",
                     "properties": {
-                        "has_pre_request_scripts": {"type": "boolean"},
-                        "has_test_scripts": {"type": "boolean"},
-                        "has_dynamic_variables": {"type": "boolean"},
-                        "has_request_chaining": {"type": "boolean"},
-                        "has_error_handling": {"type": "boolean"},
-                        "newman_compatible": {"type": "boolean"}
+                        "has_pre_request_scripts": BOOLEAN_SCHEMA,
+                        "has_test_scripts": BOOLEAN_SCHEMA,
+                        "has_dynamic_variables": BOOLEAN_SCHEMA,
+                        "has_request_chaining": BOOLEAN_SCHEMA,
+                        "has_error_handling": BOOLEAN_SCHEMA,
+                        "newman_compatible": BOOLEAN_SCHEMA
                     },
                     "required": ["has_pre_request_scripts", "has_test_scripts", "has_dynamic_variables", "has_request_chaining", "has_error_handling", "newman_compatible"],
                     "additionalProperties": False,
@@ -2,7 +2,7 @@
 from typing import Any, Callable, Dict, Optional, TypeVar, Type
 from abc import ABC, abstractmethod
 import inspect
-from functools import wraps
+from functools import cache, wraps
 
 T = TypeVar('T')
 
@@ -26,6 +26,12 @@ class ServiceContainer:
         key = self._get_service_key(interface)
         self._factories[key] = factory
 
+    def register_lazy_singleton(self, interface: Type[T], implementation_class: Type[T]) -> None:
+        """Register a singleton service created with injection on first use"""
+        key = self._get_service_key(interface)
+        self._factories[key] = cache(
+            lambda: self._create_instance(implementation_class))
+
     def register_transient(self, interface: Type[T], implementation_class: Type[T]) -> None:
         """Register a transient service (new instance each time)"""
         key = self._get_service_key(interface)
@@ -154,14 +160,14 @@ def _register_core_services(container: ServiceContainer):
 def _register_business_services(container: ServiceContainer):
     """Register business logic services"""
 
-    # LLM Service
+    # LLM Service (shared so its concurrency limit applies across agents)
     from src.services.llm_service import LLMService, OpenAILLMService
-    container.register_implementation(LLMService, OpenAILLMService)
+    container.register_lazy_singleton(LLMService, OpenAILLMService)
 
-    # Validation Service
+    # Validation Service (singleton so compiled validators are shared)
     from src.services.validation_service import ValidationService, JSONSchemaValidationService
-    container.register_implementation(
-        ValidationService, JSONSchemaValidationService)
+    container.register_singleton(
+        ValidationService, JSONSchemaValidationService())
 
     # Export Service
     from src.services.export_service import ExportService, FileExportService
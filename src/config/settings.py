@@ -1,9 +1,12 @@
 """Application settings and configuration management"""
+from functools import cache
 from pathlib import Path
 from typing import Optional
 
-from pydantic import Field, field_validator
-from pydantic_settings import BaseSettings
+from pydantic import Field, field_validator, model_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
 
 
 class Settings(BaseSettings):
@@ -39,10 +42,17 @@ class Settings(BaseSettings):
     )
 
     # Agent Configuration
-    max_concurrent_agents: int = Field(
-        3, description="Maximum concurrent agents")
+    max_concurrent_agents: Optional[int] = Field(
+        None, ge=1,
+        description="Deprecated: replaced by llm_max_concurrency, which it sets when that is not given")
     agent_timeout: int = Field(
         120, description="Agent execution timeout in seconds")
+    llm_max_concurrency: int = Field(
+        16, ge=1, description="Maximum concurrent LLM requests across all agents")
+    agent_batch_size: int = Field(
+        1, ge=1, le=8, description="Sections sent to an agent per LLM request (1 disables batching)")
+    agent_batch_token_budget: int = Field(
+        8000, description="Maximum estimated section tokens per batched LLM request")
 
     # Output Configuration
     output_directory: Path = Field(
@@ -64,10 +74,11 @@ class Settings(BaseSettings):
 
     @field_validator("log_level")
     def validate_log_level(cls, v):
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if v.upper() not in valid_levels:
-            raise ValueError(f"log_level must be one of {valid_levels}")
-        return v.upper()
+        level = v.upper()
+        if level not in VALID_LOG_LEVELS:
+            raise ValueError(
+                f"log_level must be one of {sorted(VALID_LOG_LEVELS)}")
+        return level
 
     @field_validator("output_directory", "registry_file")
     def create_directories(cls, v):
@@ -81,27 +92,29 @@ class Settings(BaseSettings):
             raise ValueError("max_file_size_mb must be between 1 and 100")
         return v
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
-        extra = "ignore"  # Ignore extra environment variables
-
-
-# Global settings instance
-_settings: Optional[Settings] = None
+    @model_validator(mode="after")
+    def apply_deprecated_concurrency(self):
+        # Honor MAX_CONCURRENT_AGENTS from older configurations until it is removed
+        if (self.max_concurrent_agents is not None
+                and "llm_max_concurrency" not in self.model_fields_set):
+            self.llm_max_concurrency = self.max_concurrent_agents
+        return self
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore"  # Ignore extra environment variables
+    )
 
 
+@cache
 def get_settings() -> Settings:
     """Get the global settings instance"""
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+    return Settings()
 
 
 def reload_settings() -> Settings:
     """Reload settings (useful for testing)"""
-    global _settings
-    _settings = Settings()
-    return _settings
+    get_settings.cache_clear()
+    return get_settings()
@@ -8,7 +8,7 @@ from typing import Dict, List, Optional, Union
 
 import aiofiles
 from openai import OpenAI
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from src.config.dependencies import inject
 from src.config.settings import Settings
@@ -27,8 +27,7 @@ class FileInfo(BaseModel):
     purpose: str = Field(default="user_data",
                          description="OpenAI file purpose")
 
-    class Config:
-        json_encoders = {Path: str}
+    model_config = ConfigDict(json_encoders={Path: str})
 
 
 class FileRegistry(BaseModel):
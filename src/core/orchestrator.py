@@ -11,7 +11,7 @@ from src.core.section_analyzer import SectionAnalyzer
 from src.core.result_compiler import ResultCompiler
 from src.core.agent_factory import AgentFactory
 from src.models.orchestrator import OrchestratorInput, OrchestratorResult, ProcessingStatus
-from src.models.agents import AgentInput, Section
+from src.models.agents import AgentInput, PreparedContext, Section
 from src.prompts.manager import PromptManager
 from src.utils.logger import get_logger
 
@@ -145,12 +145,17 @@ class TestOrchestrator:
 
         return file_ids
 
-    def _create_agent_input(self, section_data: Dict, orchestrator_input: OrchestratorInput, file_ids: Dict) -> AgentInput:
+    def _create_agent_input(self,
+                            section_data: Dict,
+                            orchestrator_input: OrchestratorInput,
+                            file_ids: Dict,
+                            run_timestamp: str) -> AgentInput:
         """Create AgentInput with proper configuration including documentation flags and output directory"""
         section = self._create_section_from_data(section_data)
 
         return AgentInput(
             section=section,
+            prepared_context=PreparedContext.from_section(section),
             swagger_file_id=file_ids.get("swagger"),
             pdf_file_id=file_ids.get("pdf"),
             swagger_content=file_ids.get("swagger_content"),
@@ -165,6 +170,9 @@ class TestOrchestrator:
                 # Output directory - CRITICAL FIX
                 "output_directory": orchestrator_input.output_directory,
 
+                # Shared by every file generated in this run
+                "run_timestamp": run_timestamp,
+
                 # Processing configuration
                 "sectioning_strategy": orchestrator_input.sectioning_strategy.value,
                 "parallel_processing": orchestrator_input.parallel_processing
@@ -191,10 +199,11 @@ class TestOrchestrator:
                 orchestrator_input.output_directory)
 
         # Create agent inputs for each section with proper configuration
+        run_timestamp = self._get_timestamp()
         agent_inputs = []
         for section_data in sections:
             agent_input = self._create_agent_input(
-                section_data, orchestrator_input, file_ids)
+                section_data, orchestrator_input, file_ids, run_timestamp)
             agent_inputs.append(agent_input)
 
         # Execute agents based on configuration with improved parallel processing
@@ -216,93 +225,115 @@ class TestOrchestrator:
         results: Dict[str, List],
         shared_postman_agent: Any
     ) -> None:
-        """Execute CSV and Karate agents in true parallel, Postman sequentially for state management"""
+        """Execute CSV and Karate agents in true parallel alongside the sequential Postman agent"""
 
         # Phase 1: Execute CSV and Karate agents in parallel
         parallel_tasks = []
+        input_batches = self._batch_agent_inputs(agent_inputs)
 
-        for agent_input in agent_inputs:
+        for batch_inputs in input_batches:
             if orchestrator_input.generate_csv:
                 csv_agent = self.agent_factory.create_csv_agent()
-                parallel_tasks.append(
-                    ("csv", agent_input.section.name, csv_agent.execute(agent_input)))
+                parallel_tasks.append(("csv", csv_agent, batch_inputs))
 
             if orchestrator_input.generate_karate:
                 karate_agent = self.agent_factory.create_karate_agent()
-                parallel_tasks.append(
-                    ("karate", agent_input.section.name, karate_agent.execute(agent_input)))
+                parallel_tasks.append(("karate", karate_agent, batch_inputs))
+
+        # Phase 2 (Postman) runs its sections in order against the shared collection state,
+        # but overlaps with the CSV/Karate batches since all agents wait on the LLM.
+        # Both branches are awaited before any error is raised, so neither keeps
+        # writing files or results after the run has been reported
+        branch_results = await asyncio.gather(
+            self._execute_parallel_batches(parallel_tasks, results),
+            self._execute_postman_sequential(
+                orchestrator_input, input_batches, results, shared_postman_agent),
+            return_exceptions=True
+        )
+        for branch_result in branch_results:
+            if isinstance(branch_result, BaseException):
+                raise branch_result
 
-        # Execute parallel tasks in batches
-        if parallel_tasks:
-            self.logger.info(
-                f"🚀 Executing {len(parallel_tasks)} parallel tasks (CSV + Karate)")
-            batch_size = self.settings.max_concurrent_agents
+    async def _execute_parallel_batches(self, parallel_tasks: List, results: Dict[str, List]) -> None:
+        """Execute CSV and Karate agent tasks concurrently, bounded by the LLM service"""
+        if not parallel_tasks:
+            return
 
-            for i in range(0, len(parallel_tasks), batch_size):
-                batch = parallel_tasks[i:i + batch_size]
-                self.logger.info(
-                    f"Processing batch {i//batch_size + 1}: {len(batch)} tasks")
-
-                batch_results = await asyncio.gather(*[task[2] for task in batch], return_exceptions=True)
-
-                # Process results
-                for (agent_type, section_name, _), result in zip(batch, batch_results):
-                    if isinstance(result, Exception):
-                        self.logger.error(
-                            f"❌ {agent_type} agent failed for {section_name}: {result}")
-                    else:
-                        results[agent_type].append(result)
-                        self.logger.info(
-                            f"✅ {agent_type} agent completed for {section_name}")
-
-        # Phase 2: Execute Postman agent sequentially (if enabled) to maintain collection state
-        if orchestrator_input.generate_postman and shared_postman_agent:
-            self.logger.info(
-                "📮 Executing Postman agent sequentially for state consistency")
-            for agent_input in agent_inputs:
-                section_name = agent_input.section.name
-                self.logger.info(
-                    f"Executing Postman agent for {section_name}...")
-                postman_result = await shared_postman_agent.execute(agent_input)
-                results["postman"].append(postman_result)
+        self.logger.info(
+            f"🚀 Executing {len(parallel_tasks)} parallel tasks (CSV + Karate)")
+
+        start_ns = time.perf_counter_ns()
+        task_results = await asyncio.gather(
+            *[agent.execute_batch(batch_inputs) for _, agent, batch_inputs in parallel_tasks],
+            return_exceptions=True)
+
+        # Process results
+        for (agent_type, agent, batch_inputs), result in zip(parallel_tasks, task_results):
+            section_name = self._get_batch_section_names(batch_inputs)
+            if isinstance(result, Exception):
+                self.logger.error(
+                    f"❌ {agent_type} agent failed for {section_name}: {result}")
+                # Report every section of the failed batch so the result counts it
+                results[agent_type].extend(
+                    agent._create_error_output(input_data, result, start_ns)
+                    for input_data in batch_inputs)
+            else:
+                results[agent_type].extend(result)
                 self.logger.info(
-                    f"✅ Postman agent completed for {section_name}")
+                    f"✅ {agent_type} agent completed for {section_name}")
 
-    async def _execute_agents_parallel(
+    async def _execute_postman_sequential(
         self,
         orchestrator_input: OrchestratorInput,
-        agent_inputs: List[AgentInput],
-        results: Dict[str, List]
+        input_batches: List[List[AgentInput]],
+        results: Dict[str, List],
+        shared_postman_agent: Any
     ) -> None:
-        """Execute agents in parallel for better performance (LEGACY METHOD - kept for compatibility)"""
-        tasks = []
+        """Execute the shared Postman agent section by section to maintain collection state"""
+        if not (orchestrator_input.generate_postman and shared_postman_agent):
+            return
+
+        self.logger.info(
+            "📮 Executing Postman agent sequentially for state consistency")
+        for batch_inputs in input_batches:
+            section_names = self._get_batch_section_names(batch_inputs)
+            self.logger.info(
+                f"Executing Postman agent for {section_names}...")
+            postman_results = await shared_postman_agent.execute_batch(batch_inputs)
+            results["postman"].extend(postman_results)
+            self.logger.info(
+                f"✅ Postman agent completed for {section_names}")
+
+    def _batch_agent_inputs(self, agent_inputs: List[AgentInput]) -> List[List[AgentInput]]:
+        """Group agent inputs into batches bounded by batch size and estimated token budget"""
+        batch_size = self.settings.agent_batch_size
+        if batch_size <= 1:
+            return [[agent_input] for agent_input in agent_inputs]
+
+        token_budget = self.settings.agent_batch_token_budget
+        batches = []
+        current_batch = []
+        current_tokens = 0
 
         for agent_input in agent_inputs:
-            if orchestrator_input.generate_csv:
-                csv_agent = self.agent_factory.create_csv_agent()
-                tasks.append(("csv", csv_agent.execute(agent_input)))
+            section_tokens = agent_input.section.estimated_tokens
+            if current_batch and (len(current_batch) >= batch_size
+                                  or current_tokens + section_tokens > token_budget):
+                batches.append(current_batch)
+                current_batch = []
+                current_tokens = 0
 
-            if orchestrator_input.generate_karate:
-                karate_agent = self.agent_factory.create_karate_agent()
-                tasks.append(("karate", karate_agent.execute(agent_input)))
+            current_batch.append(agent_input)
+            current_tokens += section_tokens
 
-            if orchestrator_input.generate_postman:
-                postman_agent = self.agent_factory.create_postman_agent()
-                tasks.append(("postman", postman_agent.execute(agent_input)))
-
-        # Execute in batches to avoid overwhelming the system
-        batch_size = self.settings.max_concurrent_agents
-        for i in range(0, len(tasks), batch_size):
-            batch = tasks[i:i + batch_size]
-            batch_results = await asyncio.gather(*[task[1] for task in batch], return_exceptions=True)
-
-            # Process results
-            for (agent_type, _), result in zip(batch, batch_results):
-                if isinstance(result, Exception):
-                    self.logger.error(f"{agent_type} agent failed: {result}")
-                else:
-                    results[agent_type].append(result)
-                    self.logger.info(f"✅ {agent_type} agent completed")
+        if current_batch:
+            batches.append(current_batch)
+
+        return batches
+
+    def _get_batch_section_names(self, batch_inputs: List[AgentInput]) -> str:
+        """Get a readable label for the sections in a batch"""
+        return ", ".join(agent_input.section.name for agent_input in batch_inputs)
 
     async def _execute_agents_sequential(
         self,
@@ -342,72 +373,28 @@ class TestOrchestrator:
         shared_postman_agent: Any
     ) -> None:
         """Execute agents sequentially using shared Postman agent instance"""
-        for agent_input in agent_inputs:
-            section_name = agent_input.section.name
+        for batch_inputs in self._batch_agent_inputs(agent_inputs):
+            section_names = self._get_batch_section_names(batch_inputs)
 
             if orchestrator_input.generate_csv:
-                self.logger.info(f"Executing CSV agent for {section_name}...")
+                self.logger.info(f"Executing CSV agent for {section_names}...")
                 csv_agent = self.agent_factory.create_csv_agent()
-                csv_result = await csv_agent.execute(agent_input)
-                results["csv"].append(csv_result)
+                csv_results = await csv_agent.execute_batch(batch_inputs)
+                results["csv"].extend(csv_results)
 
             if orchestrator_input.generate_karate:
                 self.logger.info(
-                    f"Executing Karate agent for {section_name}...")
+                    f"Executing Karate agent for {section_names}...")
                 karate_agent = self.agent_factory.create_karate_agent()
-                karate_result = await karate_agent.execute(agent_input)
-                results["karate"].append(karate_result)
+                karate_results = await karate_agent.execute_batch(batch_inputs)
+                results["karate"].extend(karate_results)
 
             if orchestrator_input.generate_postman and shared_postman_agent:
                 self.logger.info(
-                    f"Executing Postman agent for {section_name}...")
+                    f"Executing Postman agent for {section_names}...")
                 # Use the SHARED agent instance to maintain state
-                postman_result = await shared_postman_agent.execute(agent_input)
-                results["postman"].append(postman_result)
-
-    async def _execute_agents_parallel_with_shared(
-        self,
-        orchestrator_input: OrchestratorInput,
-        agent_inputs: List[AgentInput],
-        results: Dict[str, List],
-        shared_postman_agent: Any
-    ) -> None:
-        """Execute agents in parallel - but Postman agent runs sequentially to maintain state (LEGACY METHOD)"""
-        tasks = []
-
-        for agent_input in agent_inputs:
-            if orchestrator_input.generate_csv:
-                csv_agent = self.agent_factory.create_csv_agent()
-                tasks.append(("csv", csv_agent.execute(agent_input)))
-
-            if orchestrator_input.generate_karate:
-                karate_agent = self.agent_factory.create_karate_agent()
-                tasks.append(("karate", karate_agent.execute(agent_input)))
-
-        # Execute CSV and Karate in parallel
-        if tasks:
-            batch_size = self.settings.max_concurrent_agents
-            for i in range(0, len(tasks), batch_size):
-                batch = tasks[i:i + batch_size]
-                batch_results = await asyncio.gather(*[task[1] for task in batch], return_exceptions=True)
-
-                # Process results
-                for (agent_type, _), result in zip(batch, batch_results):
-                    if isinstance(result, Exception):
-                        self.logger.error(
-                            f"{agent_type} agent failed: {result}")
-                    else:
-                        results[agent_type].append(result)
-                        self.logger.info(f"✅ {agent_type} agent completed")
-
-        # Execute Postman agent SEQUENTIALLY to maintain collection state
-        if orchestrator_input.generate_postman and shared_postman_agent:
-            for agent_input in agent_inputs:
-                section_name = agent_input.section.name
-                self.logger.info(
-                    f"Executing Postman agent for {section_name}...")
-                postman_result = await shared_postman_agent.execute(agent_input)
-                results["postman"].append(postman_result)
+                postman_results = await shared_postman_agent.execute_batch(batch_inputs)
+                results["postman"].extend(postman_results)
 
     async def _finalize_postman_collection(
         self,
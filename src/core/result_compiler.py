@@ -132,6 +132,22 @@ class ResultCompiler:
         for result in csv_results:
             if isinstance(result, CsvOutput):
                 csv_outputs.append(result)
+            elif hasattr(result, 'agent_type') and result.agent_type.value == 'csv':
+                # Convert AgentOutput (e.g. a failed section) to CsvOutput
+                try:
+                    csv_output = CsvOutput(
+                        agent_type=result.agent_type,
+                        section_id=result.section_id,
+                        success=result.success,
+                        artifacts=result.artifacts,
+                        errors=result.errors,
+                        warnings=result.warnings,
+                        metadata=result.metadata
+                    )
+                    csv_outputs.append(csv_output)
+                except Exception as e:
+                    self.logger.warning(
+                        f"Failed to convert AgentOutput to CsvOutput: {e}")
             else:
                 # Handle legacy or malformed results
                 self.logger.warning(f"Invalid CSV result type: {type(result)}")
@@ -1,5 +1,7 @@
 """Core schemas for orchestrator operations"""
 
+from src.agents.base.schemas import STRING_SCHEMA
+
 # Section Analysis Schema - used by SectionAnalyzer
 SECTION_ANALYSIS_SCHEMA = {
     "type": "object",
@@ -47,12 +49,12 @@ SECTION_ANALYSIS_SCHEMA = {
                         "items": {
                             "type": "object",
                             "properties": {
-                                "path": {"type": "string"},
-                                "method": {"type": "string"},
-                                "summary": {"type": "string"},
+                                "path": STRING_SCHEMA,
+                                "method": STRING_SCHEMA,
+                                "summary": STRING_SCHEMA,
                                 "tags": {
                                     "type": "array",
-                                    "items": {"type": "string"}
+                                    "items": STRING_SCHEMA
                                 }
                             },
                             "required": ["path", "method", "summary", "tags"],
@@ -65,7 +67,7 @@ SECTION_ANALYSIS_SCHEMA = {
                         "items": {
                             "type": "object",
                             "properties": {
-                                "name": {"type": "string"},
+                                "name": STRING_SCHEMA,
                                 "test_type": {
                                     "type": "string",
                                     "enum": ["functional", "integration", "negative", "security", "performance", "boundary"]
@@ -74,7 +76,7 @@ SECTION_ANALYSIS_SCHEMA = {
                                     "type": "string",
                                     "enum": ["high", "medium", "low"]
                                 },
-                                "description": {"type": "string"}
+                                "description": STRING_SCHEMA
                             },
                             "required": ["name", "test_type", "priority", "description"],
                             "additionalProperties": False
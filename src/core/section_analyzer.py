@@ -49,9 +49,10 @@ class SectionAnalyzer:
             messages = self._build_analysis_messages(
                 orchestrator_input, file_ids, analysis_prompt)
 
-            # Get analysis schema
-            schema = self.validation_service.get_schema(
+            # Get compiled analysis validator and its schema
+            validator = self.validation_service.get_validator(
                 "section_analysis_schema")
+            schema = validator.schema
 
             # Use reasoning model for complex analysis task
             self.logger.info(
@@ -82,8 +83,10 @@ class SectionAnalyzer:
                 )
 
             # Validate the output
-            validation_errors = self.validation_service.validate(
-                llm_output, schema)
+            validation_errors = [
+                f"Validation error: {error.message}"
+                for error in validator.iter_errors(llm_output)
+            ]
             if validation_errors:
                 self.logger.warning(
                     f"Analysis output validation warnings: {validation_errors}")
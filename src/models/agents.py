@@ -1,11 +1,21 @@
 """Agent-specific models"""
-from typing import Any, Dict, List, Optional
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from .base import AgentType, BaseSection, BaseEndpoint, BaseTestCase, ExecutionMetrics
 
 
+_SECTION_CONTEXT_HEADER = """
+## Section: {name}
+
+**Description:** {description}
+
+**Endpoints to Process:**
+"""
+
+
 class Section(BaseSection):
     """Extended section with endpoints and test cases"""
     endpoints: List[BaseEndpoint] = Field(
@@ -15,16 +25,102 @@ class Section(BaseSection):
     estimated_tokens: int = Field(
         default=0, description="Estimated tokens for processing")
 
+    # Frozen so the cached values below cannot go stale
+    model_config = ConfigDict(use_enum_values=True, frozen=True)
+
+    @cached_property
+    def endpoint_count(self) -> int:
+        """Number of endpoints in the section"""
+        return len(self.endpoints)
+
+    @cached_property
+    def test_case_count(self) -> int:
+        """Number of test cases in the section"""
+        return len(self.test_cases)
+
+    @cached_property
+    def context_text(self) -> str:
+        """Section context for the agents' user message, built once"""
+        parts = [_SECTION_CONTEXT_HEADER.format(
+            name=self.name, description=self.description)]
+        parts.extend(
+            f"\n- {endpoint.method} {endpoint.path}: {endpoint.summary}"
+            if endpoint.summary else f"\n- {endpoint.method} {endpoint.path}"
+            for endpoint in self.endpoints
+        )
+
+        parts.append("\n\n**Test Cases to Generate:**")
+        parts.extend(
+            f"\n- {test_case.name} ({test_case.test_type})"
+            for test_case in self.test_cases
+        )
+
+        return "".join(parts)
+
+
+class PreparedContext(BaseModel):
+    """Immutable section context shared by every agent processing a section"""
+    section_text: str = Field(..., description="Section context for the user message")
+
+    model_config = ConfigDict(frozen=True)
+
+    @classmethod
+    def from_section(cls, section: Section) -> "PreparedContext":
+        """Share the section's context text with all agents"""
+        return cls(section_text=section.context_text)
+
+
+def _swagger_text_attachment(swagger_content: str) -> Dict[str, Any]:
+    """Inline the Swagger/OpenAPI specification as text"""
+    return {
+        "type": "input_text",
+        "text": f"## Swagger/OpenAPI Specification\n\n```yaml\n{swagger_content}\n```"
+    }
+
+
+def _file_attachment(file_id: str) -> Dict[str, Any]:
+    """Reference an uploaded file by its ID"""
+    return {
+        "type": "input_file",
+        "file_id": file_id
+    }
+
+
+# User message attachments in order; within a group the first field set is used
+_ATTACHMENT_BUILDERS = (
+    # Swagger content is sent as text; the file ID is a fallback
+    (("swagger_content", _swagger_text_attachment),
+     ("swagger_file_id", _file_attachment)),
+    # PDFs are supported as uploaded files by the Responses API
+    (("pdf_file_id", _file_attachment),),
+)
+
 
 class AgentInput(BaseModel):
     """Input data for agent execution"""
     section: Section = Field(..., description="Section to process")
+    prepared_context: Optional[PreparedContext] = Field(
+        None, description="Precomputed section context shared across agents")
     swagger_file_id: Optional[str] = Field(None, description="Swagger file ID")
+    swagger_content: Optional[str] = Field(
+        None, description="Swagger/OpenAPI specification text")
     pdf_file_id: Optional[str] = Field(None, description="PDF file ID")
     user_prompt: Optional[str] = Field(None, description="User instructions")
     agent_config: Dict[str, Any] = Field(
         default_factory=dict, description="Agent-specific configuration")
 
+    @cached_property
+    def attachments(self) -> Tuple[Dict[str, Any], ...]:
+        """File attachments for the user message, built once for all agents"""
+        attachments = []
+        for group in _ATTACHMENT_BUILDERS:
+            for field_name, build in group:
+                value = getattr(self, field_name)
+                if value:
+                    attachments.append(build(value))
+                    break
+        return tuple(attachments)
+
 
 class AgentOutput(BaseModel):
     """Base output from agent execution"""
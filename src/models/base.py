@@ -4,7 +4,7 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class AgentType(str, Enum):
@@ -45,8 +45,7 @@ class BaseSection(BaseModel):
     name: str = Field(..., description="Section name")
     description: str = Field(..., description="Section description")
 
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
 
 
 class BaseEndpoint(BaseModel):
@@ -56,8 +55,7 @@ class BaseEndpoint(BaseModel):
     summary: Optional[str] = Field(None, description="Endpoint summary")
     tags: List[str] = Field(default_factory=list, description="Endpoint tags")
 
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
 
 
 class BaseTestCase(BaseModel):
@@ -69,8 +67,7 @@ class BaseTestCase(BaseModel):
     description: Optional[str] = Field(
         None, description="Test case description")
 
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
 
 
 class TokenUsage(BaseModel):
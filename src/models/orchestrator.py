@@ -169,6 +169,22 @@ class OrchestratorResult(BaseModel):
                 artifacts.extend(output.artifacts)
         return artifacts
 
+    @property
+    def artifacts_by_type(self) -> Dict[str, List[str]]:
+        """Generated artifacts grouped by type, taken from the agent outputs"""
+        postman_files = [
+            path
+            for output in self.postman_outputs
+            for path in [output.collection_file, *output.environment_files]
+            if path
+        ]
+        return {
+            "csv": [output.csv_file for output in self.csv_outputs if output.csv_file],
+            "feature": [path for output in self.karate_outputs for path in output.feature_files],
+            # The consolidated collection is shared by every Postman output
+            "postman": list(dict.fromkeys(postman_files))
+        }
+
     @property
     def has_errors(self) -> bool:
         """Check if any errors occurred during processing"""
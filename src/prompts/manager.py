@@ -2,6 +2,7 @@
 """Advanced prompt management system with versioning and templating"""
 import re
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 from dataclasses import dataclass
@@ -55,6 +56,8 @@ class PromptTemplate:
         self.metadata = metadata
         self.parent = parent
         self._variables = self._extract_variables()
+        self._all_variables = frozenset(self._variables).union(
+            parent._all_variables if parent else ())
 
     def _extract_variables(self) -> List[str]:
         """Extract variable placeholders from prompt content"""
@@ -81,6 +84,18 @@ class PromptTemplate:
 
         return content.strip()
 
+    def bind(self, constants: Dict[str, Any]) -> 'PromptTemplate':
+        """Pre-render constant variables into a standalone template"""
+        content = self.render(constants)
+        return PromptTemplate(content, self.metadata)
+
+    def render_key(self, variables: Dict[str, Any]) -> tuple:
+        """Build a hashable key from the variables this template references"""
+        return tuple(sorted(
+            (name, str(variables[name]))
+            for name in self._all_variables if name in variables
+        ))
+
     def validate_variables(self, variables: Dict[str, Any]) -> List[str]:
         """Validate that all required variables are provided"""
         missing = []
@@ -98,6 +113,7 @@ class PromptManager:
         self.logger = get_logger("prompt_manager")
         self._templates: Dict[str, PromptTemplate] = {}
         self._metadata_cache: Dict[str, PromptMetadata] = {}
+        self._compile_cached = lru_cache(maxsize=64)(self._compile)
 
         # Load all prompts on initialization
         self._load_prompts()
@@ -204,6 +220,18 @@ class PromptManager:
         template = self.get_template(prompt_name, version)
         return template.render(variables or {})
 
+    def compile(self,
+                prompt_name: str,
+                constants: Optional[Dict[str, Any]] = None) -> PromptTemplate:
+        """Get a template with its constant variables already rendered"""
+        template = self.get_template(prompt_name)
+        return self._compile_cached(
+            prompt_name, template.render_key(constants or {}))
+
+    def _compile(self, prompt_name: str, frozen_constants: tuple) -> PromptTemplate:
+        """Bind frozen constant variables into a template"""
+        return self.get_template(prompt_name).bind(dict(frozen_constants))
+
     def get_template(self,
                      prompt_name: str,
                      version: Optional[str] = None) -> PromptTemplate:
@@ -280,6 +308,7 @@ class PromptManager:
         """Reload all prompts from disk"""
         self._templates.clear()
         self._metadata_cache.clear()
+        self._compile_cached.cache_clear()
         self._load_prompts()
         self.logger.info("Prompts reloaded successfully")
 
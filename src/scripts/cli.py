@@ -10,20 +10,15 @@ from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
-# Add project root to path for imports
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
-
+# Container, settings and orchestrator imports are deferred to the commands that
+# need them so --help and argument errors don't load the OpenAI/agent stack
 try:
-    from src.config.dependencies import get_container
-    from src.core.orchestrator import TestOrchestrator
     from src.models.orchestrator import OrchestratorInput, OrchestratorResult, SectioningStrategy
 except ImportError as e:
     print(f"❌ Import error: {e}")
     print(f"Make sure you're running from the project root directory")
     print(f"Current working directory: {Path.cwd()}")
     print(f"Script location: {Path(__file__).parent}")
-    print(f"Project root: {project_root}")
     sys.exit(1)
 
 
@@ -85,8 +80,9 @@ def generate(
 def status():
     """📊 Show orchestrator status and configuration"""
     try:
-        container = get_container()
+        from src.config.dependencies import get_container
         from src.config.settings import Settings
+        container = get_container()
         settings = container.get(Settings)
 
         status_table = Table(title="🔧 Orchestrator Status")
@@ -109,8 +105,9 @@ def status():
 def prompts():
     """📝 List available prompt templates"""
     try:
-        container = get_container()
+        from src.config.dependencies import get_container
         from src.prompts.manager import PromptManager
+        container = get_container()
         prompt_manager = container.get(PromptManager)
 
         available_prompts = prompt_manager.list_available_prompts()
@@ -151,6 +148,8 @@ async def _execute_with_progress(orchestrator_input: OrchestratorInput) -> Orche
 
         try:
             # Get orchestrator from dependency injection container
+            from src.config.dependencies import get_container
+            from src.core.orchestrator import TestOrchestrator
             container = get_container()
             orchestrator = container.get(TestOrchestrator)
 
@@ -1,12 +1,18 @@
 """File export and artifact management service"""
-import json
+import asyncio
 import csv
+import io
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import orjson
 
 from src.utils.logger import get_logger
 
+# Large write buffer so big CSVs go to disk in few write() calls
+_CSV_WRITE_BUFFER_SIZE = 1 << 20
+
 
 class ExportService(ABC):
     """Abstract export service interface"""
@@ -16,6 +22,11 @@ class ExportService(ABC):
         """Export data to CSV file"""
         pass
 
+    @abstractmethod
+    async def export_csv_rows(self, rows: Iterable[List[str]], output_path: Path, headers: List[str]) -> Path:
+        """Export positional rows, already ordered like the headers, to CSV file"""
+        pass
+
     @abstractmethod
     async def export_json(self, data: Dict[str, Any], output_path: Path) -> Path:
         """Export data to JSON file"""
@@ -26,6 +37,21 @@ class ExportService(ABC):
         """Export text content to file"""
         pass
 
+    @abstractmethod
+    async def export_batch(self, files: Sequence[Tuple[Path, Union[str, bytes]]]) -> List[Path]:
+        """Write several already rendered files in one batch"""
+        pass
+
+    @abstractmethod
+    def render_csv(self, data: List[Dict[str, Any]], headers: List[str]) -> str:
+        """Render data as CSV content, as export_csv would write it"""
+        pass
+
+    @abstractmethod
+    def render_json(self, data: Dict[str, Any]) -> bytes:
+        """Render data as JSON content, as export_json would write it"""
+        pass
+
 
 class FileExportService(ExportService):
     """File-based export service implementation"""
@@ -39,22 +65,8 @@ class FileExportService(ExportService):
             # Ensure output directory exists
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile, quoting=csv.QUOTE_ALL)
-
-                # Write headers
-                writer.writerow(headers)
-
-                # Write data rows
-                for row_data in data:
-                    row = []
-                    for header in headers:
-                        value = row_data.get(header, "")
-                        # Handle multiline content
-                        if isinstance(value, (list, dict)):
-                            value = json.dumps(value, ensure_ascii=False)
-                        row.append(str(value))
-                    writer.writerow(row)
+            with open(output_path, 'w', newline='', encoding='utf-8', buffering=_CSV_WRITE_BUFFER_SIZE) as csvfile:
+                self._write_csv_data(csvfile, data, headers)
 
             self.logger.info(
                 f"Exported {len(data)} rows to CSV: {output_path}")
@@ -64,15 +76,66 @@ class FileExportService(ExportService):
             self.logger.error(f"CSV export failed: {e}")
             raise
 
+    async def export_csv_rows(self, rows: Iterable[List[str]], output_path: Path, headers: List[str]) -> Path:
+        """Export positional rows, already ordered like the headers, to CSV file"""
+        try:
+            # Write in a worker thread so the event loop keeps serving other agents
+            await asyncio.to_thread(self._write_csv_rows, rows, output_path, headers)
+
+            self.logger.info(f"Exported CSV rows to: {output_path}")
+            return output_path
+
+        except Exception as e:
+            self.logger.error(f"CSV export failed: {e}")
+            raise
+
+    def render_csv(self, data: List[Dict[str, Any]], headers: List[str]) -> str:
+        """Render data as CSV content, as export_csv would write it"""
+        buffer = io.StringIO(newline='')
+        self._write_csv_data(buffer, data, headers)
+        return buffer.getvalue()
+
+    def _write_csv_data(self, csvfile: Any, data: List[Dict[str, Any]], headers: List[str]) -> None:
+        """Write headers and dictionary rows to an open CSV file"""
+        writer = csv.writer(csvfile, quoting=csv.QUOTE_ALL)
+
+        # Write headers
+        writer.writerow(headers)
+
+        # Write data rows
+        for row_data in data:
+            row = []
+            for header in headers:
+                value = row_data.get(header, "")
+                # Handle multiline content
+                if isinstance(value, (list, dict)):
+                    value = orjson.dumps(
+                        value, option=orjson.OPT_NON_STR_KEYS, default=str).decode()
+                row.append(str(value))
+            writer.writerow(row)
+
+    def _write_csv_rows(self, rows: Iterable[List[str]], output_path: Path, headers: List[str]) -> None:
+        """Write headers and rows to a CSV file"""
+        try:
+            csvfile = open(output_path, 'w', newline='', encoding='utf-8', buffering=_CSV_WRITE_BUFFER_SIZE)
+        except FileNotFoundError:
+            # Create the output directory only the first time it is missing
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            csvfile = open(output_path, 'w', newline='', encoding='utf-8', buffering=_CSV_WRITE_BUFFER_SIZE)
+
+        with csvfile:
+            writer = csv.writer(csvfile, quoting=csv.QUOTE_ALL)
+            writer.writerow(headers)
+            writer.writerows(rows)
+
     async def export_json(self, data: Dict[str, Any], output_path: Path) -> Path:
         """Export data to JSON file"""
         try:
             # Ensure output directory exists
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(output_path, 'w', encoding='utf-8') as jsonfile:
-                json.dump(data, jsonfile, indent=2,
-                          ensure_ascii=False, default=str)
+            with open(output_path, 'wb') as jsonfile:
+                jsonfile.write(self.render_json(data))
 
             self.logger.info(f"Exported JSON data to: {output_path}")
             return output_path
@@ -81,6 +144,16 @@ class FileExportService(ExportService):
             self.logger.error(f"JSON export failed: {e}")
             raise
 
+    def render_json(self, data: Dict[str, Any]) -> bytes:
+        """Render data as JSON content, as export_json would write it"""
+        # Datetimes are passed through to str() so they keep the
+        # "2024-01-02 03:04:05" form rather than orjson's RFC 3339 output
+        return orjson.dumps(
+            data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+            default=str
+        )
+
     async def export_text(self, text: str, output_path: Path) -> Path:
         """Export text content to file"""
         try:
@@ -96,3 +169,29 @@ class FileExportService(ExportService):
         except Exception as e:
             self.logger.error(f"Text export failed: {e}")
             raise
+
+    async def export_batch(self, files: Sequence[Tuple[Path, Union[str, bytes]]]) -> List[Path]:
+        """Write several already rendered files in one batch"""
+        try:
+            # One worker thread writes every file instead of a round trip per file
+            await asyncio.to_thread(self._write_files, files)
+
+            self.logger.info(f"Exported {len(files)} files in one batch")
+            return [output_path for output_path, _ in files]
+
+        except Exception as e:
+            self.logger.error(f"Batch export failed: {e}")
+            raise
+
+    def _write_files(self, files: Sequence[Tuple[Path, Union[str, bytes]]]) -> None:
+        """Write each file's content, creating each output directory once"""
+        created_dirs = set()
+        for output_path, content in files:
+            if output_path.parent not in created_dirs:
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                created_dirs.add(output_path.parent)
+
+            if isinstance(content, str):
+                content = content.encode('utf-8')
+            with open(output_path, 'wb') as output_file:
+                output_file.write(content)
@@ -1,13 +1,19 @@
 """LLM service abstraction"""
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, Tuple
-import json
-from openai import OpenAI
+import asyncio
+import orjson
+from openai import AsyncOpenAI, OpenAIError
 
 from src.config.settings import Settings
 from src.utils.logger import get_logger
 
 
+class LLMServiceError(Exception):
+    """Raised when the LLM provider call fails or returns an unusable response"""
+    pass
+
+
 class LLMService(ABC):
     """Abstract LLM service interface"""
 
@@ -33,11 +39,13 @@ class OpenAILLMService(LLMService):
     def __init__(self, settings: Settings):
         self.settings = settings
         self.logger = get_logger("llm_service")
-        self.client = OpenAI(
+        self.client = AsyncOpenAI(
             api_key=settings.openai_api_key,
             timeout=settings.openai_timeout,
             max_retries=settings.openai_max_retries
         )
+        # Bounds in-flight requests for every agent sharing this service
+        self._semaphore = asyncio.Semaphore(settings.llm_max_concurrency)
 
     async def generate_structured_response(self,
                                            messages: List[Dict[str, Any]],
@@ -49,21 +57,22 @@ class OpenAILLMService(LLMService):
             input_messages = self._convert_messages_to_responses_format(
                 messages)
 
-            response = self.client.responses.create(
-                model=model or self.settings.default_model,
-                input=input_messages,
-                text={
-                    "format": {
-                        "type": "json_schema",
-                        "name": "structured_output",
-                        "schema": schema,
-                        "strict": True
-                    }
-                },
-            )
+            async with self._semaphore:
+                response = await self.client.responses.create(
+                    model=model or self.settings.default_model,
+                    input=input_messages,
+                    text={
+                        "format": {
+                            "type": "json_schema",
+                            "name": "structured_output",
+                            "schema": schema,
+                            "strict": True
+                        }
+                    },
+                )
 
             # Extract the structured result
-            result = json.loads(response.output_text)
+            result = orjson.loads(response.output_text)
 
             # Extract usage information from Responses API
             usage_info = self._extract_usage_info(response)
@@ -73,9 +82,10 @@ class OpenAILLMService(LLMService):
 
             return result, usage_info
 
-        except Exception as e:
+        except (OpenAIError, orjson.JSONDecodeError) as e:
             self.logger.error(f"LLM structured response failed: {e}")
-            raise
+            raise LLMServiceError(
+                f"LLM structured response failed: {e}") from e
 
     async def generate_text_response(self,
                                      messages: List[Dict[str, Any]],
@@ -86,10 +96,11 @@ class OpenAILLMService(LLMService):
             input_messages = self._convert_messages_to_responses_format(
                 messages)
 
-            response = self.client.responses.create(
-                model=model or self.settings.default_model,
-                input=input_messages
-            )
+            async with self._semaphore:
+                response = await self.client.responses.create(
+                    model=model or self.settings.default_model,
+                    input=input_messages
+                )
 
             # Extract usage information
             usage_info = self._extract_usage_info(response)
@@ -99,9 +110,9 @@ class OpenAILLMService(LLMService):
 
             return response.output_text, usage_info
 
-        except Exception as e:
+        except OpenAIError as e:
             self.logger.error(f"LLM text response failed: {e}")
-            raise
+            raise LLMServiceError(f"LLM text response failed: {e}") from e
 
     def _convert_messages_to_responses_format(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Convert standard messages format to Responses API format"""
@@ -1,6 +1,7 @@
 """Output validation service"""
 import json
 import jsonschema
+import orjson
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional
 
@@ -25,6 +26,11 @@ class ValidationService(ABC):
         """Register a new schema"""
         pass
 
+    @abstractmethod
+    def get_validator(self, schema_name: str) -> Any:
+        """Get a compiled validator for a registered schema"""
+        pass
+
 
 class JSONSchemaValidationService(ValidationService):
     """JSON Schema-based validation service"""
@@ -32,14 +38,20 @@ class JSONSchemaValidationService(ValidationService):
     def __init__(self):
         self.logger = get_logger("validation_service")
         self._schemas: Dict[str, Dict[str, Any]] = {}
+        self._validators: Dict[str, Any] = {}
+        self._schema_names: Dict[int, str] = {}
+        self._validators_by_content: Dict[bytes, Any] = {}
         self._load_default_schemas()
 
     def _load_default_schemas(self) -> None:
         """Load default schemas from agent modules"""
         try:
             # Import and register CSV schema
-            from src.agents.csv.schemas import CSV_TEST_CASE_SCHEMA
+            from src.agents.csv.schemas import (
+                CSV_TEST_CASE_SCHEMA, CSV_TEST_CASE_ITEM_SCHEMA, CSV_VALIDATION_SCHEMA)
             self.register_schema("csv_test_case_schema", CSV_TEST_CASE_SCHEMA)
+            self.register_schema("csv_test_case_item_schema", CSV_TEST_CASE_ITEM_SCHEMA)
+            self.register_schema("csv_validation_schema", CSV_VALIDATION_SCHEMA)
 
             # Import and register Postman schema
             from src.agents.postman.schemas import POSTMAN_COLLECTION_SCHEMA
@@ -70,7 +82,10 @@ class JSONSchemaValidationService(ValidationService):
         errors = []
 
         try:
-            jsonschema.validate(instance=data, schema=schema)
+            error = jsonschema.exceptions.best_match(
+                self._get_validator_for(schema).iter_errors(data))
+            if error is not None:
+                raise error
         except jsonschema.ValidationError as e:
             errors.append(f"Validation error: {e.message}")
         except jsonschema.SchemaError as e:
@@ -81,5 +96,35 @@ class JSONSchemaValidationService(ValidationService):
         return errors
 
     def register_schema(self, name: str, schema: Dict[str, Any]) -> None:
-        """Register a new schema"""
+        """Register a new schema; its validator is compiled on first use"""
         self._schemas[name] = schema
+        self._schema_names[id(schema)] = name
+        self._validators.pop(name, None)
+
+    def get_validator(self, schema_name: str) -> Any:
+        """Get a compiled validator for a registered schema, building it once"""
+        validator = self._validators.get(schema_name)
+        if validator is None:
+            validator = self._compile(self.get_schema(schema_name))
+            self._validators[schema_name] = validator
+        return validator
+
+    def _get_validator_for(self, schema: Dict[str, Any]) -> Any:
+        """Get a compiled validator for a schema object, registered or not"""
+        schema_name = self._schema_names.get(id(schema))
+        if schema_name is not None and self._schemas.get(schema_name) is schema:
+            return self.get_validator(schema_name)
+
+        # Unregistered or copied schema: reuse the validator compiled for equal content
+        content_key = orjson.dumps(schema, option=orjson.OPT_SORT_KEYS)
+        validator = self._validators_by_content.get(content_key)
+        if validator is None:
+            validator = self._compile(schema)
+            self._validators_by_content[content_key] = validator
+        return validator
+
+    def _compile(self, schema: Dict[str, Any]) -> Any:
+        """Check a schema and build its validator"""
+        validator_class = jsonschema.validators.validator_for(schema)
+        validator_class.check_schema(schema)
+        return validator_class(schema)